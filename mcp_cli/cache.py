@@ -0,0 +1,51 @@
+"""On-disk cache helpers for mcp-tool.
+
+Cache files live under ``$XDG_CACHE_HOME/mcp-tool`` (``~/.cache/mcp-tool``
+by default). They are always written atomically so that concurrent CLI
+invocations never observe a partially written file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_DIR_NAME = "mcp-tool"
+
+
+def get_cache_dir() -> Path:
+    """Return the directory used for mcp-tool cache files.
+
+    The directory is not created by this function.
+    """
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base_dir / CACHE_DIR_NAME
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temporary file and ``os.replace``.
+
+    Args:
+        path: Destination file path. Parent directories are created as needed.
+        data: Raw bytes to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
@@ -10,42 +10,82 @@ This module provides a thin abstraction over the MCP Python SDK in order to:
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
-import shutil
+import warnings
+import weakref
+from collections.abc import Awaitable, Callable, Hashable
 from contextlib import AsyncExitStack
-from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
 
-import mcp.types as types
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-from mcp.client.streamable_http import streamablehttp_client
-from rich.console import Console
-from rich.text import Text
+from .config import MergedConfig, ServerConfig, find_executable
+from .descriptors import ToolDescriptor
 
-from .config import MergedConfig, ServerConfig
+if TYPE_CHECKING:
+    # The MCP SDK pulls in pydantic, anyio and httpx; it is imported lazily in
+    # McpServerClient.initialize() so that help rendering does not pay for it.
+    import mcp.types as types
+    from mcp import ClientSession
+    from rich.console import Console
+    from rich.status import Status
 
 
-@dataclass
-class ToolDescriptor:
-    """Description of a tool exposed by an MCP server.
+# Upper bound on the number of MCP servers started concurrently during discovery.
+# Server start-up is mostly interpreter boot (node, python), so starting more
+# processes than a laptop has cores at once slows every one of them down.
+MAX_CONCURRENT_DISCOVERY = 8
 
-    Attributes:
-        server_name: Logical name of the MCP server.
-        tool_name: Name of the tool as reported by the server.
-        description: Human-readable description of the tool.
-        input_schema: JSON Schema describing the tool input.
-        title: Optional user-facing title if provided by the server.
+# Seconds a single server may take to start and list its tools during discovery.
+# The default is generous because launchers such as ``npx`` or ``uvx`` may
+# download the server on first use; set the variable to fail fast instead.
+DISCOVERY_TIMEOUT_ENV = "MCP_TOOL_DISCOVERY_TIMEOUT"
+DEFAULT_DISCOVERY_TIMEOUT = 30.0
+
+
+def get_discovery_timeout() -> float:
+    """Return the per-server discovery timeout in seconds."""
+
+    raw_timeout = os.environ.get(DISCOVERY_TIMEOUT_ENV)
+    if raw_timeout:
+        try:
+            timeout = float(raw_timeout)
+        except ValueError:
+            return DEFAULT_DISCOVERY_TIMEOUT
+        if timeout > 0:
+            return timeout
+    return DEFAULT_DISCOVERY_TIMEOUT
+
+
+@functools.lru_cache(maxsize=1)
+def _stderr_console() -> Console:
+    """Return the console used for discovery progress and errors.
+
+    rich is imported on first use so that commands which never discover
+    tools, such as cached help listings, do not pay for it.
     """
 
-    server_name: str
-    tool_name: str
-    description: str
-    input_schema: dict[str, Any]
-    title: str | None = None
+    from rich.console import Console
 
+    return Console(stderr=True)
 
-console = Console(stderr=True)
+
+def _finalize_unclosed_client(server_name: str, handles: list[IO[str]]) -> None:
+    """Release what a garbage-collected, never cleaned up client still holds.
+
+    The SDK transports are anyio context managers that have to be exited from
+    the task that entered them, so they cannot be closed from a finalizer.
+    Synchronous handles are closed here and the leak is reported instead.
+    """
+
+    for handle in handles:
+        handle.close()
+    warnings.warn(
+        f"MCP client for server '{server_name}' was garbage collected "
+        "without cleanup().",
+        ResourceWarning,
+        stacklevel=2,
+    )
 
 
 class McpServerClient:
@@ -56,16 +96,21 @@ class McpServerClient:
     used within a single CLI invocation.
     """
 
-    def __init__(self, config: ServerConfig) -> None:
+    def __init__(self, config: ServerConfig, cwd: str | Path | None = None) -> None:
         """Initialize a client for the given server configuration.
 
         Args:
             config: Server configuration containing command, args and env.
+            cwd: Optional working directory for stdio server processes. When
+                omitted, the server inherits the current working directory.
         """
 
         self._config: ServerConfig = config
+        self._cwd: str | Path | None = cwd
         self._exit_stack: AsyncExitStack = AsyncExitStack()
         self._session: ClientSession | None = None
+        self._handles: list[IO[str]] = []
+        self._finalizer: weakref.finalize | None = None
 
     @property
     def name(self) -> str:
@@ -76,9 +121,21 @@ class McpServerClient:
     async def initialize(self) -> None:
         """Start the MCP server connection and establish a client session."""
 
+        from mcp import ClientSession
+
+        if self._finalizer is None:
+            self._finalizer = weakref.finalize(
+                self, _finalize_unclosed_client, self._config.name, self._handles
+            )
+            # Only report clients that are garbage collected without cleanup();
+            # live pooled clients are still closed by the CLI's own exit hook.
+            self._finalizer.atexit = False
+
         server_type = getattr(self._config, "type", "stdio").lower()
 
         if server_type == "http":
+            from mcp.client.streamable_http import streamablehttp_client
+
             if not self._config.url:
                 message = f"Server '{self._config.name}' is missing 'url' for HTTP transport."
                 raise RuntimeError(message)
@@ -101,26 +158,31 @@ class McpServerClient:
             return
 
         # Default to stdio-based transport.
+        from mcp import StdioServerParameters
+        from mcp.client.stdio import stdio_client
+
         if not self._config.command:
             message = f"Server '{self._config.name}' is missing 'command' for stdio transport."
             raise RuntimeError(message)
 
         # Resolve the executable path when possible, but fall back to the raw
         # command string if it is not found in PATH.
-        resolved_command = shutil.which(self._config.command) or self._config.command
+        resolved_command = find_executable(self._config.command) or self._config.command
 
         merged_env: dict[str, str] | None = None
         if self._config.env:
-            merged_env = dict(os.environ)
-            merged_env.update(self._config.env)
+            # Built per start so that later changes to ``os.environ`` apply.
+            merged_env = {**os.environ, **self._config.env}
 
         server_params = StdioServerParameters(
             command=resolved_command,
-            args=self._config.args,
+            args=self._config.args or [],
             env=merged_env,
+            cwd=self._cwd,
         )
 
         devnull = self._exit_stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+        self._handles.append(devnull)
 
         stdio_transport = await self._exit_stack.enter_async_context(stdio_client(server_params, errlog=devnull))
         read, write = stdio_transport
@@ -143,31 +205,16 @@ class McpServerClient:
             raise RuntimeError(message)
 
         tools_response = await self._session.list_tools()
-        descriptors: list[ToolDescriptor] = []
-
-        for item in tools_response:
-            if not isinstance(item, tuple):
-                continue
-            kind, payload = item
-            if kind != "tools":
-                continue
-
-            for tool in payload:
-                description = getattr(tool, "description", "") or ""
-                input_schema = getattr(tool, "inputSchema", {}) or {}
-                title = getattr(tool, "title", None)
-
-                descriptors.append(
-                    ToolDescriptor(
-                        server_name=self._config.name,
-                        tool_name=tool.name,
-                        description=description,
-                        input_schema=input_schema,
-                        title=title,
-                    )
-                )
-
-        return descriptors
+        return [
+            ToolDescriptor(
+                server_name=self._config.name,
+                tool_name=tool.name,
+                description=tool.description or "",
+                input_schema=tool.inputSchema or {},
+                title=tool.title,
+            )
+            for tool in tools_response.tools
+        ]
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> types.CallToolResult:
         """Execute a tool on this server.
@@ -190,40 +237,390 @@ class McpServerClient:
         return await self._session.call_tool(tool_name, arguments)
 
     async def cleanup(self) -> None:
-        """Close the client session and stop the server process."""
+        """Close the client session and stop the server process.
 
-        if self._session is None:
-            # Nothing to clean up.
-            return
+        The exit stack is closed even when :meth:`initialize` did not finish,
+        so that a transport started by a failed or cancelled handshake does not
+        leak its server process. Clients that are garbage collected without
+        being cleaned up emit a :class:`ResourceWarning`.
+        """
 
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
         try:
             await self._exit_stack.aclose()
         finally:
             self._session = None
+            self._handles.clear()
+
+
+_WorkerRequest = tuple[
+    Callable[..., Awaitable[Any]],
+    tuple[Any, ...],
+    "asyncio.Future[Any]",
+]
+
+
+class ServerWorker:
+    """Keep a single MCP server session alive across multiple requests.
 
+    The MCP SDK transports are built on anyio and must be entered and exited
+    by the same task. A worker therefore runs its :class:`McpServerClient` in
+    a dedicated task for the whole session lifetime and executes requests
+    submitted from other tasks on its behalf.
+    """
+
+    def __init__(self, config: ServerConfig, cwd: str | Path | None = None) -> None:
+        """Create a worker for the given server configuration.
+
+        Args:
+            config: Server configuration the worker connects to.
+            cwd: Optional working directory for stdio server processes.
+        """
+
+        self._config: ServerConfig = config
+        self._cwd: str | Path | None = cwd
+        self._requests: asyncio.Queue[_WorkerRequest | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return whether the worker task is alive and accepting requests."""
+
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the worker task and wait until the session is initialized.
+
+        Raises:
+            Exception: Any error raised while starting the server.
+        """
 
-async def _discover_from_servers(servers: list[ServerConfig]) -> list[ToolDescriptor]:
-    """Discover tools from the provided server configurations."""
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(
+            self._run(ready), name=f"mcp-server-{self._config.name}"
+        )
+        try:
+            await ready
+        except asyncio.CancelledError:
+            # Do not leave a half-started session behind when the caller
+            # gives up, e.g. because a timeout expired.
+            await self.abort()
+            raise
+
+    async def list_tools(self) -> list[ToolDescriptor]:
+        """Return all tools exposed by the server."""
+
+        return await self._submit(McpServerClient.list_tools)
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> types.CallToolResult:
+        """Execute a tool on the server."""
+
+        return await self._submit(McpServerClient.call_tool, tool_name, arguments)
+
+    async def aclose(self) -> None:
+        """Stop the worker, closing the session and the server process."""
+
+        if self._task is None:
+            return
+        if not self._task.done():
+            self._requests.put_nowait(None)
+        try:
+            await self._task
+        except Exception:
+            # Errors while shutting a session down are not actionable here.
+            pass
+
+    async def abort(self) -> None:
+        """Cancel the worker task, abandoning any request still in progress.
+
+        Unlike :meth:`aclose`, this does not wait for the current request to
+        finish, so it also stops a session whose server stopped responding.
+        """
+
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _submit(self, method: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        if not self.running:
+            message = f"Session for server '{self._config.name}' is not running."
+            raise RuntimeError(message)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._requests.put_nowait((method, args, future))
+        return await future
+
+    async def _run(self, ready: asyncio.Future[None]) -> None:
+        client = McpServerClient(self._config, cwd=self._cwd)
+        try:
+            try:
+                await client.initialize()
+            except BaseException as exc:
+                if not ready.done():
+                    ready.set_exception(exc)
+                if not isinstance(exc, Exception):
+                    raise
+                return
+            if ready.done():
+                # The caller stopped waiting for the session to start.
+                return
+            ready.set_result(None)
+
+            while True:
+                request = await self._requests.get()
+                if request is None:
+                    return
+                method, args, future = request
+                try:
+                    result = await method(client, *args)
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                except BaseException:
+                    if not future.done():
+                        future.set_exception(
+                            RuntimeError(
+                                f"Session for server '{self._config.name}' was stopped."
+                            )
+                        )
+                    raise
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._fail_pending()
+            await client.cleanup()
+
+    def _fail_pending(self) -> None:
+        while not self._requests.empty():
+            request = self._requests.get_nowait()
+            if request is not None and not request[2].done():
+                request[2].set_exception(
+                    RuntimeError(
+                        f"Session for server '{self._config.name}' was stopped."
+                    )
+                )
+
+
+def server_config_key(config: ServerConfig, cwd: str | Path | None = None) -> Hashable:
+    """Return a hashable key identifying the server process ``config`` starts."""
+
+    return (
+        config.name,
+        config.type,
+        config.command,
+        tuple(config.args or ()),
+        tuple(sorted((config.env or {}).items())),
+        config.url,
+        tuple(sorted((config.headers or {}).items())),
+        config.timeout,
+        config.sse_read_timeout,
+        str(cwd) if cwd is not None else None,
+    )
+
+
+class ClientPool:
+    """Long-lived :class:`ServerWorker` instances keyed by server configuration."""
+
+    def __init__(self) -> None:
+        self._workers: dict[Hashable, ServerWorker] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    async def get(
+        self, config: ServerConfig, cwd: str | Path | None = None
+    ) -> ServerWorker:
+        """Return a running worker for ``config``, starting one if needed."""
+
+        key = server_config_key(config, cwd)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            worker = self._workers.get(key)
+            if worker is not None and worker.running:
+                return worker
+
+            worker = ServerWorker(config, cwd=cwd)
+            await worker.start()
+            self._workers[key] = worker
+            return worker
+
+    async def list_tools(
+        self,
+        config: ServerConfig,
+        cwd: str | Path | None = None,
+        *,
+        timeout: float | None = None,
+    ) -> list[ToolDescriptor]:
+        """Discover tools through a pooled session for ``config``.
+
+        The session stays open afterwards, so a following :meth:`call_tool`
+        for the same server reuses it instead of starting the server again.
+
+        Args:
+            config: Server configuration to discover tools from.
+            cwd: Optional working directory for stdio server processes.
+            timeout: Seconds the server may take to start and list its tools;
+                defaults to :func:`get_discovery_timeout`. A session that runs
+                out of time is discarded.
+        """
+
+        async def _start_and_list() -> list[ToolDescriptor]:
+            worker = await self.get(config, cwd)
+            return await worker.list_tools()
+
+        budget = get_discovery_timeout() if timeout is None else timeout
+        try:
+            with _loading_status([config]):
+                return await asyncio.wait_for(_start_and_list(), budget)
+        except asyncio.TimeoutError as exc:
+            worker = self._workers.pop(server_config_key(config, cwd), None)
+            if worker is not None:
+                await worker.abort()
+            message = (
+                f"Server '{config.name}' did not respond within {budget:g} seconds."
+            )
+            raise RuntimeError(message) from exc
+
+    async def call_tool(
+        self,
+        config: ServerConfig,
+        tool_name: str,
+        arguments: dict[str, Any],
+        cwd: str | Path | None = None,
+    ) -> types.CallToolResult:
+        """Execute a tool through a pooled session for ``config``.
+
+        When the call raises, the session is discarded so that the next call
+        starts from a fresh server process instead of a possibly broken one.
+        """
+
+        worker = await self.get(config, cwd)
+        try:
+            return await worker.call_tool(tool_name, arguments)
+        except Exception:
+            key = server_config_key(config, cwd)
+            if self._workers.get(key) is worker:
+                del self._workers[key]
+            await worker.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        """Stop all pooled workers."""
+
+        workers = list(self._workers.values())
+        self._workers.clear()
+        await asyncio.gather(*(worker.aclose() for worker in workers))
+
+
+def _loading_status(servers: list[ServerConfig]) -> Status:
+    """Return a stderr spinner shown while ``servers`` are being loaded."""
+
+    from rich.text import Text
+
+    server_names = ", ".join(server.name for server in servers)
+    return _stderr_console().status(
+        Text(f"Loading MCP servers: {server_names}", style="green")
+    )
+
+
+async def _discover_from_servers(
+    servers: list[ServerConfig],
+    *,
+    isolate_failures: bool = True,
+    timeout: float | None = None,
+) -> list[ToolDescriptor]:
+    """Discover tools from the provided server configurations.
+
+    Servers are started concurrently, at most ``MAX_CONCURRENT_DISCOVERY`` at
+    a time, and each one gets ``timeout`` seconds to start and list its tools.
+    Every server runs in its own task that issues ``list_tools`` as soon as its
+    own handshake completes, so handshakes and listings are already pipelined
+    across servers and a slow server never delays the others.
+
+    Args:
+        servers: Server configurations to discover tools from.
+        isolate_failures: When true, a server that fails or times out is
+            reported on stderr and skipped so that tools from the remaining
+            servers are still returned. When false, the first error is raised.
+        timeout: Per-server time budget in seconds; defaults to
+            :func:`get_discovery_timeout`.
+
+    Returns:
+        A list of :class:`ToolDescriptor` instances across all servers that
+        were discovered successfully.
+    """
 
     descriptors: list[ToolDescriptor] = []
+    if not servers:
+        return descriptors
 
-    async def _load_for_server(server_config: ServerConfig) -> None:
+    budget = get_discovery_timeout() if timeout is None else timeout
+
+    semaphore = asyncio.Semaphore(min(MAX_CONCURRENT_DISCOVERY, len(servers)))
+
+    async def _load_for_server(server_config: ServerConfig) -> list[ToolDescriptor]:
         client = McpServerClient(server_config)
         try:
             await client.initialize()
-            server_tools = await client.list_tools()
-            descriptors.extend(server_tools)
+            return await client.list_tools()
         finally:
             await client.cleanup()
 
-    if not servers:
-        return descriptors
+    async def _load_bounded(server_config: ServerConfig) -> list[ToolDescriptor]:
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + budget
+            try:
+                # wait_for runs the load in its own task, so the transport
+                # contexts are entered and exited by the same task even when
+                # the timeout cancels it.
+                return await asyncio.wait_for(_load_for_server(server_config), budget)
+            except Exception as exc:
+                # Cancelling a stdio transport mid-handshake can surface as an
+                # ExceptionGroup from the SDK's task group rather than as a
+                # TimeoutError, so report anything raised past the deadline as
+                # a timeout.
+                if not isinstance(exc, asyncio.TimeoutError) and loop.time() < deadline:
+                    raise
+                message = (
+                    f"Server '{server_config.name}' did not respond within "
+                    f"{budget:g} seconds."
+                )
+                raise RuntimeError(message) from exc
 
-    server_names = ", ".join(server.name for server in servers)
-    status_text = Text(f"Loading MCP servers: {server_names}", style="green")
+    import anyio
+    from rich.text import Text
+
+    console = _stderr_console()
 
-    with console.status(status_text):
-        await asyncio.gather(*(_load_for_server(server) for server in servers))
+    results: list[list[ToolDescriptor] | Exception] = [[] for _ in servers]
+
+    async def _collect(index: int, server_config: ServerConfig) -> None:
+        try:
+            results[index] = await _load_bounded(server_config)
+        except Exception as exc:
+            results[index] = exc
+
+    # The task group guarantees that every per-server task, including its
+    # cleanup, has finished before discovery returns, even on cancellation.
+    with _loading_status(servers):
+        async with anyio.create_task_group() as task_group:
+            for index, server in enumerate(servers):
+                task_group.start_soon(_collect, index, server)
+
+    for server, result in zip(servers, results):
+        if isinstance(result, Exception):
+            if not isolate_failures:
+                raise result
+            console.print(
+                Text(
+                    f"Failed to load MCP server '{server.name}': {result}", style="red"
+                )
+            )
+            continue
+        descriptors.extend(result)
 
     return descriptors
 
@@ -231,6 +628,9 @@ async def _discover_from_servers(servers: list[ServerConfig]) -> list[ToolDescri
 async def discover_tools(config: MergedConfig) -> list[ToolDescriptor]:
     """Discover tools from all servers defined in the merged configuration.
 
+    Servers that fail to start or do not respond in time are reported on
+    stderr and skipped, so one broken server does not hide the others.
+
     Args:
         config: Merged configuration containing all known servers.
 
@@ -252,10 +652,14 @@ async def discover_tools_for_server(config: MergedConfig, server_name: str) -> l
     Returns:
         A list of :class:`ToolDescriptor` instances for the requested server.
         If the server is not present in the configuration, an empty list is returned.
+
+    Raises:
+        RuntimeError: If the server does not respond in time.
+        Exception: Any error raised while starting the server or listing tools.
     """
 
     server_config = config.servers.get(server_name)
     if server_config is None:
         return []
 
-    return await _discover_from_servers([server_config])
+    return await _discover_from_servers([server_config], isolate_failures=False)
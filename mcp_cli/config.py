@@ -4,13 +4,33 @@ This module is responsible for locating MCP configuration files, parsing
 their contents, and merging the configured MCP servers into a single view.
 """
 
-import json
-from dataclasses import dataclass, field
+import os
+import pickle
+import shutil
+import stat
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from . import jsonutil
+from .cache import get_cache_dir, write_bytes_atomic
+
 MCP_SERVERS_KEY = "mcpServers"
 
+# Set to a truthy value to bypass the on-disk cache of parsed configuration.
+NO_CONFIG_CACHE_ENV = "MCP_TOOL_NO_CONFIG_CACHE"
+
+CONFIG_CACHE_FILENAME = "config.pkl"
+
+# Bump whenever the pickled layout of ``MergedConfig``/``ServerConfig`` changes.
+_CONFIG_CACHE_VERSION = 2
+
+_TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
+
+# ``(path, st_mtime_ns, st_size)`` for every configuration file that was read.
+ConfigFingerprint = tuple[tuple[str, int, int], ...]
+
 
 class ConfigError(Exception):
     """Base exception for configuration-related errors."""
@@ -24,7 +44,7 @@ class InvalidConfigError(ConfigError):
     """Raised when an MCP configuration file is malformed or invalid."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     """Configuration for a single MCP server.
 
@@ -38,15 +58,18 @@ class ServerConfig:
         headers: HTTP headers to send when connecting to HTTP-based servers.
         timeout: Optional HTTP timeout in seconds for HTTP servers.
         sse_read_timeout: Optional SSE read timeout in seconds for HTTP servers.
+
+    Container fields are ``None`` when not set in the configuration, which
+    avoids allocating empty lists and dicts for every server.
     """
 
     name: str
     command: str | None = None
-    args: list[str] = field(default_factory=list)
-    env: dict[str, str] = field(default_factory=dict)
+    args: list[str] | None = None
+    env: dict[str, str] | None = None
     type: str = "stdio"
     url: str | None = None
-    headers: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] | None = None
     timeout: float | None = None
     sse_read_timeout: float | None = None
 
@@ -58,6 +81,67 @@ class MergedConfig:
     servers: dict[str, ServerConfig]
 
 
+def env_flag(name: str) -> bool:
+    """Return whether the environment variable ``name`` is set to a truthy value."""
+
+    return os.environ.get(name, "").strip().lower() in _TRUTHY_ENV_VALUES
+
+
+# Found executables keyed by command, ``PATH`` value and, for commands given
+# as a path, the working directory they are resolved against.
+_executable_cache: dict[tuple[str, str, str | None], str] = {}
+
+
+def find_executable(command: str) -> str | None:
+    """Return :func:`shutil.which` for ``command`` on ``PATH``, memoized.
+
+    Several servers commonly share a launcher such as ``uvx`` or ``npx``; this
+    avoids walking every ``PATH`` entry again for each of them. Misses are not
+    cached, so a long-lived daemon picks up servers installed after it started.
+    """
+
+    path = os.environ.get("PATH", os.defpath)
+    has_dir = os.sep in command or (os.altsep is not None and os.altsep in command)
+    key = (command, path, os.getcwd() if has_dir else None)
+    executable = _executable_cache.get(key)
+    if executable is None:
+        executable = shutil.which(command, path=path)
+        if executable is not None:
+            _executable_cache[key] = executable
+    return executable
+
+
+def _scan_config_paths(
+    base_dir: Path,
+) -> tuple[list[Path], list[tuple[Path, os.stat_result]]]:
+    """Locate configuration files, stat-ing each candidate path once.
+
+    Args:
+        base_dir: Working directory used for the project-local locations.
+
+    Returns:
+        A ``(candidates, existing)`` tuple. ``candidates`` lists all search
+        locations in ascending priority order (used for error messages), and
+        ``existing`` pairs each regular file among them with its stat result.
+    """
+
+    candidates = [
+        Path.home() / ".mcp.json",
+        base_dir / ".claude" / "mcp.json",
+        base_dir / "mcp.json",
+    ]
+
+    existing: list[tuple[Path, os.stat_result]] = []
+    for path in candidates:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(stat_result.st_mode):
+            existing.append((path, stat_result))
+    return candidates, existing
+
+
 def get_default_config_paths(cwd: Path | None = None) -> list[Path]:
     """Return existing configuration file paths in priority order.
 
@@ -75,17 +159,27 @@ def get_default_config_paths(cwd: Path | None = None) -> list[Path]:
         order.
     """
 
-    base_dir = cwd or Path.cwd()
+    _candidates, existing = _scan_config_paths(cwd or Path.cwd())
+    return [path for path, _stat_result in existing]
+
 
-    home_config = Path.home() / ".mcp.json"
-    claude_config = base_dir / ".claude" / "mcp.json"
-    local_config = base_dir / "mcp.json"
+def _read_file_bytes(path: Path) -> bytes:
+    """Read ``path`` with raw ``os.read`` calls, bypassing Python's IO stack."""
 
-    existing_paths: list[Path] = []
-    for path in (home_config, claude_config, local_config):
-        if path.is_file():
-            existing_paths.append(path)
-    return existing_paths
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks: list[bytes] = []
+        while True:
+            # ``os.read`` may return short reads; keep going until EOF.
+            chunk = os.read(fd, max(remaining, 1 << 16))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
 
 
 def _load_raw_configs(paths: list[Path]) -> list[tuple[Path, dict[str, Any]]]:
@@ -105,13 +199,13 @@ def _load_raw_configs(paths: list[Path]) -> list[tuple[Path, dict[str, Any]]]:
     raw_configs: list[tuple[Path, dict[str, Any]]] = []
     for path in paths:
         try:
-            text = path.read_text(encoding="utf-8")
+            raw = _read_file_bytes(path)
         except OSError as exc:  # pragma: no cover - unexpected I/O failure
             raise InvalidConfigError(f"Failed to read config file: {path}") from exc
 
         try:
-            data = json.loads(text)
-        except json.JSONDecodeError as exc:
+            data = jsonutil.loads(raw)
+        except jsonutil.JSONDecodeError as exc:
             message = f"Invalid JSON in config file: {path}"
             raise InvalidConfigError(message) from exc
 
@@ -164,30 +258,66 @@ def _merge_server_maps(
                 merged[server_name] = dict(server_value)
                 continue
 
-            combined: dict[str, Any] = dict(existing)
-
-            # Shallow-merge environment variables if present in either config.
-            existing_env = existing.get("env")
+            # Shallow-merge environment variables; a later non-object `env`
+            # never replaces an earlier one.
             new_env = server_value.get("env")
-            if isinstance(existing_env, dict) or isinstance(new_env, dict):
-                env_merged: dict[str, Any] = {}
+            if isinstance(new_env, dict):
+                existing_env = existing.get("env")
                 if isinstance(existing_env, dict):
-                    env_merged.update(existing_env)
-                if isinstance(new_env, dict):
-                    env_merged.update(new_env)
-                combined["env"] = env_merged
+                    existing["env"] = {**existing_env, **new_env}
+                else:
+                    existing["env"] = dict(new_env)
 
             # For all other keys, later config wins.
-            for key, value in server_value.items():
-                if key == "env":
-                    continue
-                combined[key] = value
-
-            merged[server_name] = combined
+            existing.update(
+                (key, value) for key, value in server_value.items() if key != "env"
+            )
 
     return merged
 
 
+def _string_map(
+    value: Any, *, invalid_message: str, entry_message: str
+) -> dict[str, str] | None:
+    """Validate an optional JSON object of string keys and values.
+
+    Args:
+        value: Raw value from the configuration; ``None`` means "not set".
+        invalid_message: Error message used when ``value`` is not an object.
+        entry_message: Error message used when a key or value is not a string.
+
+    Returns:
+        A new ``dict`` with the validated entries, or ``None`` when unset.
+
+    Raises:
+        InvalidConfigError: If the value or any of its entries has the wrong type.
+    """
+
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        raise InvalidConfigError(invalid_message)
+    if not all(
+        isinstance(key, str) and isinstance(item, str) for key, item in value.items()
+    ):
+        raise InvalidConfigError(entry_message)
+    return dict(value)
+
+
+def _optional_seconds(value: Any, message: str) -> float | None:
+    """Validate an optional number of seconds.
+
+    Raises:
+        InvalidConfigError: With ``message`` if ``value`` is set but not a number.
+    """
+
+    if value is None:
+        return None
+    if not isinstance(value, (int, float)):
+        raise InvalidConfigError(message)
+    return float(value)
+
+
 def _server_from_mapping(name: str, data: dict[str, Any]) -> ServerConfig:
     """Create a :class:`ServerConfig` instance from a raw mapping.
 
@@ -221,99 +351,175 @@ def _server_from_mapping(name: str, data: dict[str, Any]) -> ServerConfig:
         message = f"Server '{name}' has an invalid 'type' field; expected a string."
         raise InvalidConfigError(message)
 
-    server_type = raw_type.lower()
-
-    # HTTP-based StreamableHTTP server.
-    if server_type == "http":
-        url_value = data.get("url")
-        if not isinstance(url_value, str) or not url_value:
-            message = (
-                f"Server '{name}' is missing a non-empty 'url' field for HTTP server."
-            )
-            raise InvalidConfigError(message)
-
-        headers_value = data.get("headers", {})
-        headers: dict[str, str] = {}
-        if isinstance(headers_value, dict):
-            for key, value in headers_value.items():
-                if not isinstance(key, str) or not isinstance(value, str):
-                    message = (
-                        f"Server '{name}' has non-string HTTP header name or value."
-                    )
-                    raise InvalidConfigError(message)
-                headers[key] = value
-        elif headers_value is not None:
-            message = f"Server '{name}' has an invalid 'headers' field; expected an object or null."
-            raise InvalidConfigError(message)
-
-        timeout_value = data.get("timeout")
-        timeout: float | None = None
-        if timeout_value is not None:
-            if not isinstance(timeout_value, (int, float)):
-                message = f"Server '{name}' has an invalid 'timeout' field; expected a number."
-                raise InvalidConfigError(message)
-            timeout = float(timeout_value)
-
-        sse_timeout_raw = data.get("sseReadTimeout", data.get("sse_read_timeout"))
-        sse_read_timeout: float | None = None
-        if sse_timeout_raw is not None:
-            if not isinstance(sse_timeout_raw, (int, float)):
-                message = f"Server '{name}' has an invalid 'sseReadTimeout' field; expected a number."
-                raise InvalidConfigError(message)
-            sse_read_timeout = float(sse_timeout_raw)
-
-        return ServerConfig(
-            name=name,
-            type="http",
-            url=url_value,
-            headers=headers,
-            timeout=timeout,
-            sse_read_timeout=sse_read_timeout,
-        )
-
-    # Default to stdio-based servers.
-    if server_type != "stdio":
+    validator = _VALIDATORS.get(raw_type.lower())
+    if validator is None:
         message = f"Server '{name}' has unsupported 'type' value '{raw_type}'."
         raise InvalidConfigError(message)
+    return validator(name, data)
+
+
+def _from_stdio(name: str, data: dict[str, Any]) -> ServerConfig:
+    """Validate a stdio server mapping; see :func:`_server_from_mapping`."""
 
     command_value = data.get("command")
     if not isinstance(command_value, str) or not command_value:
         message = f"Server '{name}' is missing a non-empty 'command' field."
         raise InvalidConfigError(message)
 
-    args_value = data.get("args", [])
-    if not isinstance(args_value, list) or not all(
-        isinstance(item, str) for item in args_value
+    # An absent 'args' means no arguments; an explicit null is rejected.
+    args_value = data.get("args")
+    if "args" in data and (
+        not isinstance(args_value, list)
+        or not all(isinstance(item, str) for item in args_value)
     ):
         message = (
             f"Server '{name}' has an invalid 'args' field; expected a list of strings."
         )
         raise InvalidConfigError(message)
 
-    env_value = data.get("env", {})
-    env: dict[str, str] = {}
-    if isinstance(env_value, dict):
-        for key, value in env_value.items():
-            if not isinstance(key, str) or not isinstance(value, str):
-                message = (
-                    f"Server '{name}' has non-string environment variable key or value."
-                )
-                raise InvalidConfigError(message)
-            env[key] = value
-    elif env_value is not None:
-        message = (
+    env = _string_map(
+        data.get("env"),
+        invalid_message=(
             f"Server '{name}' has an invalid 'env' field; expected an object or null."
-        )
+        ),
+        entry_message=(
+            f"Server '{name}' has non-string environment variable key or value."
+        ),
+    )
+
+    return ServerConfig(
+        name=name,
+        command=command_value,
+        args=list(args_value) if args_value is not None else None,
+        env=env,
+        type="stdio",
+    )
+
+
+def _from_http(name: str, data: dict[str, Any]) -> ServerConfig:
+    """Validate a StreamableHTTP server mapping; see :func:`_server_from_mapping`."""
+
+    url_value = data.get("url")
+    if not isinstance(url_value, str) or not url_value:
+        message = f"Server '{name}' is missing a non-empty 'url' field for HTTP server."
         raise InvalidConfigError(message)
 
+    headers = _string_map(
+        data.get("headers"),
+        invalid_message=(
+            f"Server '{name}' has an invalid 'headers' field; "
+            "expected an object or null."
+        ),
+        entry_message=f"Server '{name}' has non-string HTTP header name or value.",
+    )
+    timeout = _optional_seconds(
+        data.get("timeout"),
+        f"Server '{name}' has an invalid 'timeout' field; expected a number.",
+    )
+    sse_read_timeout = _optional_seconds(
+        data.get("sseReadTimeout", data.get("sse_read_timeout")),
+        f"Server '{name}' has an invalid 'sseReadTimeout' field; expected a number.",
+    )
+
     return ServerConfig(
-        name=name, command=command_value, args=list(args_value), env=env, type="stdio"
+        name=name,
+        type="http",
+        url=url_value,
+        headers=headers,
+        timeout=timeout,
+        sse_read_timeout=sse_read_timeout,
+    )
+
+
+# Validators for each supported (lower-cased) transport ``type``.
+_VALIDATORS: dict[str, Callable[[str, dict[str, Any]], ServerConfig]] = {
+    "stdio": _from_stdio,
+    "http": _from_http,
+}
+
+
+# Most recently loaded configuration in this process, with its fingerprint.
+_loaded_config: tuple[ConfigFingerprint, MergedConfig] | None = None
+
+
+def _config_fingerprint(
+    existing: list[tuple[Path, os.stat_result]],
+) -> ConfigFingerprint:
+    """Return a fingerprint identifying the current contents of the config files."""
+
+    return tuple(
+        (str(path), stat_result.st_mtime_ns, stat_result.st_size)
+        for path, stat_result in existing
     )
 
 
+def _config_cache_path() -> Path:
+    """Return the location of the pickled configuration cache."""
+
+    return get_cache_dir() / CONFIG_CACHE_FILENAME
+
+
+def _read_config_cache(fingerprint: ConfigFingerprint) -> MergedConfig | None:
+    """Return the cached configuration when it matches ``fingerprint``.
+
+    Any problem reading or unpickling the cache is treated as a cache miss.
+    """
+
+    try:
+        payload = pickle.loads(_config_cache_path().read_bytes())
+    except Exception:
+        return None
+
+    if not isinstance(payload, tuple) or len(payload) != 3:
+        return None
+
+    version, cached_fingerprint, merged = payload
+    if version != _CONFIG_CACHE_VERSION or cached_fingerprint != fingerprint:
+        return None
+    if not isinstance(merged, MergedConfig):
+        return None
+    return merged
+
+
+def _write_config_cache(fingerprint: ConfigFingerprint, merged: MergedConfig) -> None:
+    """Persist ``merged`` for later invocations, ignoring write failures."""
+
+    payload = (_CONFIG_CACHE_VERSION, fingerprint, merged)
+    try:
+        write_bytes_atomic(_config_cache_path(), pickle.dumps(payload, protocol=5))
+    except OSError:
+        # The cache is an optimization only; never fail config loading on it.
+        pass
+
+
+def _build_merged_config(paths: list[Path]) -> MergedConfig:
+    """Parse, merge and validate the configuration files at ``paths``."""
+
+    raw_configs = _load_raw_configs(paths)
+    server_maps = _merge_server_maps(raw_configs)
+    if not server_maps:
+        message = (
+            "No 'mcpServers' entries were found in any configuration file. "
+            "Please define at least one server in mcp.json."
+        )
+        raise ConfigNotFoundError(message)
+
+    servers: dict[str, ServerConfig] = {}
+    for server_name, server_data in server_maps.items():
+        servers[server_name] = _server_from_mapping(server_name, server_data)
+
+    return MergedConfig(servers=servers)
+
+
 def load_merged_config(cwd: Path | None = None) -> MergedConfig:
     """Load and merge MCP configuration from the standard config locations.
 
+    The parsed result is cached on disk keyed by the path, modification time
+    and size of every configuration file, so unchanged configuration is not
+    re-parsed on subsequent invocations. Within a process the last result is
+    also kept in memory under the same key, so repeated calls only ``stat``
+    the files. Set ``MCP_TOOL_NO_CONFIG_CACHE=1`` to bypass both caches.
+
     Args:
         cwd: Optional working directory. If not provided, uses the current
             working directory.
@@ -327,17 +533,8 @@ def load_merged_config(cwd: Path | None = None) -> MergedConfig:
         InvalidConfigError: If any configuration file is malformed.
     """
 
-    base_dir = cwd or Path.cwd()
-
-    # Compute the three canonical search locations for user feedback.
-    candidate_paths = [
-        Path.home() / ".mcp.json",
-        base_dir / ".claude" / "mcp.json",
-        base_dir / "mcp.json",
-    ]
-
-    existing_paths = get_default_config_paths(base_dir)
-    if not existing_paths:
+    candidate_paths, existing = _scan_config_paths(cwd or Path.cwd())
+    if not existing:
         locations = ", ".join(str(path) for path in candidate_paths)
         message = (
             "No MCP configuration files found. Looked for the following paths: "
@@ -345,17 +542,21 @@ def load_merged_config(cwd: Path | None = None) -> MergedConfig:
         )
         raise ConfigNotFoundError(message)
 
-    raw_configs = _load_raw_configs(existing_paths)
-    server_maps = _merge_server_maps(raw_configs)
-    if not server_maps:
-        message = (
-            "No 'mcpServers' entries were found in any configuration file. "
-            "Please define at least one server in mcp.json."
-        )
-        raise ConfigNotFoundError(message)
-
-    servers: dict[str, ServerConfig] = {}
-    for server_name, server_data in server_maps.items():
-        servers[server_name] = _server_from_mapping(server_name, server_data)
-
-    return MergedConfig(servers=servers)
+    existing_paths = [path for path, _stat_result in existing]
+    use_cache = not env_flag(NO_CONFIG_CACHE_ENV)
+    fingerprint = _config_fingerprint(existing)
+
+    global _loaded_config
+    if use_cache:
+        if _loaded_config is not None and _loaded_config[0] == fingerprint:
+            return _loaded_config[1]
+        cached = _read_config_cache(fingerprint)
+        if cached is not None:
+            _loaded_config = (fingerprint, cached)
+            return cached
+
+    merged = _build_merged_config(existing_paths)
+    if use_cache:
+        _write_config_cache(fingerprint, merged)
+        _loaded_config = (fingerprint, merged)
+    return merged
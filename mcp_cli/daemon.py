@@ -0,0 +1,340 @@
+"""Optional background daemon that keeps MCP server sessions alive.
+
+Starting a stdio MCP server and completing the ``initialize`` handshake often
+takes hundreds of milliseconds to seconds. When ``MCP_TOOL_DAEMON=1`` is set,
+tool calls are routed through a long-running daemon that holds one session
+per server open across CLI invocations, starting the daemon on demand.
+
+The daemon listens on a Unix domain socket. Each connection carries a single
+JSON request, terminated by EOF, and receives a single JSON response:
+
+* ``{"op": "ping"}``
+* ``{"op": "call_tool", "server": {...}, "cwd": "...", "tool": "...",
+  "arguments": {...}}``
+* ``{"op": "shutdown"}``
+
+Responses are ``{"ok": true, ...}`` or ``{"ok": false, "error": "..."}``.
+Server processes inherit the environment of the process that started the
+daemon and run in the working directory of the CLI invocation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import json
+import os
+import socket
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import eventloop, jsonutil
+from .cache import get_cache_dir
+from .client import ClientPool
+from .config import ServerConfig
+
+if TYPE_CHECKING:
+    import mcp.types as types
+
+# Set to a truthy value to route tool calls through the daemon.
+DAEMON_ENV = "MCP_TOOL_DAEMON"
+
+# Seconds without requests after which the daemon shuts itself down.
+IDLE_TIMEOUT_ENV = "MCP_TOOL_DAEMON_IDLE_TIMEOUT"
+DEFAULT_IDLE_TIMEOUT = 900.0
+
+SOCKET_NAME = "mcp-cli.sock"
+
+# Budget for probing an existing daemon, and for waiting on a freshly spawned one.
+CONNECT_TIMEOUT = 0.05
+SPAWN_TIMEOUT = 5.0
+
+_SERVER_CONFIG_FIELDS = frozenset(
+    field.name for field in dataclasses.fields(ServerConfig)
+)
+
+
+class DaemonUnavailableError(RuntimeError):
+    """Raised when the daemon cannot be reached."""
+
+
+def daemon_supported() -> bool:
+    """Return whether this platform supports the Unix-socket daemon."""
+
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_socket_path() -> Path:
+    """Return the Unix socket path the daemon listens on."""
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / SOCKET_NAME
+    return get_cache_dir() / SOCKET_NAME
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _server_config_from_payload(payload: Any) -> ServerConfig:
+    if not isinstance(payload, dict) or not _SERVER_CONFIG_FIELDS.issuperset(payload):
+        raise ValueError("Invalid server configuration in daemon request.")
+    return ServerConfig(**payload)
+
+
+class _Daemon:
+    """Request dispatcher bound to a single :class:`ClientPool`."""
+
+    def __init__(self, idle_timeout: float) -> None:
+        self._pool = ClientPool()
+        self._idle_timeout = idle_timeout
+        self._stop = asyncio.Event()
+        self._active_requests = 0
+        self._last_activity = asyncio.get_running_loop().time()
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._active_requests += 1
+        try:
+            try:
+                request = jsonutil.loads(await reader.read())
+                response = await self._dispatch(request)
+            except Exception as exc:
+                response = {"ok": False, "error": str(exc) or type(exc).__name__}
+            writer.write(_encode(response))
+            await writer.drain()
+        finally:
+            self._active_requests -= 1
+            self._last_activity = asyncio.get_running_loop().time()
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def _dispatch(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict):
+            raise ValueError("Daemon requests must be JSON objects.")
+
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True}
+        if op == "shutdown":
+            self._stop.set()
+            return {"ok": True}
+        if op != "call_tool":
+            raise ValueError(f"Unknown daemon operation '{op}'.")
+
+        server_config = _server_config_from_payload(request.get("server"))
+        tool_name = request.get("tool")
+        arguments = request.get("arguments") or {}
+        cwd = request.get("cwd")
+        if not isinstance(tool_name, str) or not isinstance(arguments, dict):
+            raise ValueError("Invalid 'call_tool' request.")
+
+        result = await self._pool.call_tool(
+            server_config, tool_name, arguments, cwd=cwd
+        )
+        return {
+            "ok": True,
+            "result": result.model_dump(mode="json", by_alias=True, exclude_none=True),
+        }
+
+    async def wait_until_idle(self) -> None:
+        loop = asyncio.get_running_loop()
+        while not self._stop.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self._stop.wait(), timeout=min(self._idle_timeout, 5.0)
+                )
+            idle_for = loop.time() - self._last_activity
+            if self._active_requests == 0 and idle_for >= self._idle_timeout:
+                return
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+async def serve_forever(
+    socket_path: Path | None = None, idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+) -> None:
+    """Serve daemon requests until shut down or idle for ``idle_timeout`` seconds.
+
+    Args:
+        socket_path: Unix socket to listen on; defaults to :func:`get_socket_path`.
+        idle_timeout: Seconds without requests after which the daemon exits.
+    """
+
+    path = socket_path or get_socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lock_fd = _acquire_daemon_lock(path)
+    if lock_fd is None:
+        # Another daemon already serves this socket, or is about to.
+        return
+
+    try:
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+
+        daemon = _Daemon(idle_timeout)
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                daemon.handle_connection, path=str(path)
+            )
+        finally:
+            os.umask(old_umask)
+
+        try:
+            async with server:
+                await daemon.wait_until_idle()
+        finally:
+            await daemon.aclose()
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+    finally:
+        os.close(lock_fd)
+
+
+def _acquire_daemon_lock(socket_path: Path) -> int | None:
+    """Lock the file next to ``socket_path`` for the lifetime of one daemon.
+
+    CLI invocations that find no daemon at the same time each spawn one; only
+    the daemon holding the lock may replace the socket, so the others exit
+    instead of orphaning it. The lock is released when the process exits.
+
+    Returns:
+        The locked file descriptor, or ``None`` if another daemon holds it.
+    """
+
+    import fcntl
+
+    lock_path = socket_path.with_name(f"{socket_path.name}.lock")
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
+
+
+async def _request(
+    path: Path, payload: dict[str, Any], connect_timeout: float = CONNECT_TIMEOUT
+) -> dict[str, Any]:
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(str(path)), connect_timeout
+        )
+    except (OSError, asyncio.TimeoutError) as exc:
+        raise DaemonUnavailableError(
+            f"mcp-tool daemon is not reachable at {path}."
+        ) from exc
+
+    try:
+        writer.write(_encode(payload))
+        writer.write_eof()
+        await writer.drain()
+        response = jsonutil.loads(await reader.read())
+    finally:
+        writer.close()
+        with contextlib.suppress(Exception):
+            await writer.wait_closed()
+
+    if not isinstance(response, dict):
+        raise RuntimeError("Malformed response from mcp-tool daemon.")
+    return response
+
+
+async def _ping(path: Path) -> bool:
+    try:
+        response = await _request(path, {"op": "ping"})
+    except (OSError, ValueError, RuntimeError):
+        return False
+    return bool(response.get("ok"))
+
+
+def _spawn_daemon() -> None:
+    subprocess.Popen(
+        [sys.executable, "-m", "mcp_cli.daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+
+
+async def _ensure_daemon(path: Path) -> bool:
+    if await _ping(path):
+        return True
+
+    _spawn_daemon()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SPAWN_TIMEOUT
+    while loop.time() < deadline:
+        await asyncio.sleep(CONNECT_TIMEOUT)
+        if await _ping(path):
+            return True
+    return False
+
+
+async def call_tool_via_daemon(
+    server_config: ServerConfig,
+    tool_name: str,
+    arguments: dict[str, Any],
+) -> types.CallToolResult | None:
+    """Execute a tool through the daemon, starting it when necessary.
+
+    Returns:
+        The tool result, or ``None`` when the daemon is unsupported or could
+        not be started, in which case callers should run the tool in-process.
+
+    Raises:
+        RuntimeError: If the daemon reports that the tool call failed.
+    """
+
+    if not daemon_supported():
+        return None
+
+    path = get_socket_path()
+    if not await _ensure_daemon(path):
+        return None
+
+    payload = {
+        "op": "call_tool",
+        "server": dataclasses.asdict(server_config),
+        "cwd": os.getcwd(),
+        "tool": tool_name,
+        "arguments": arguments,
+    }
+    try:
+        response = await _request(path, payload)
+    except DaemonUnavailableError:
+        return None
+
+    if not response.get("ok"):
+        raise RuntimeError(str(response.get("error") or "Unknown daemon error."))
+
+    import mcp.types as types
+
+    return types.CallToolResult.model_validate(response.get("result"))
+
+
+def main() -> None:
+    """Run the daemon in the foreground."""
+
+    idle_timeout = DEFAULT_IDLE_TIMEOUT
+    raw_timeout = os.environ.get(IDLE_TIMEOUT_ENV)
+    if raw_timeout:
+        with contextlib.suppress(ValueError):
+            idle_timeout = float(raw_timeout)
+
+    eventloop.run(serve_forever(idle_timeout=idle_timeout))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
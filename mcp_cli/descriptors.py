@@ -0,0 +1,30 @@
+"""Plain data describing the tools exposed by MCP servers.
+
+Kept apart from :mod:`mcp_cli.client` so that code which only handles
+cached descriptors, such as help rendering, does not import asyncio and the
+client machinery.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class ToolDescriptor:
+    """Description of a tool exposed by an MCP server.
+
+    Attributes:
+        server_name: Logical name of the MCP server.
+        tool_name: Name of the tool as reported by the server.
+        description: Human-readable description of the tool.
+        input_schema: JSON Schema describing the tool input.
+        title: Optional user-facing title if provided by the server.
+    """
+
+    server_name: str
+    tool_name: str
+    description: str
+    input_schema: dict[str, Any]
+    title: str | None = None
@@ -0,0 +1,38 @@
+"""Event loop helpers that prefer the optional ``uvloop`` package.
+
+``uvloop`` is a libuv-based drop-in replacement for the asyncio event loop,
+with faster loop creation, subprocess spawning and pipe reads, which is what
+stdio MCP sessions spend their time on. It is an optional dependency
+(``mcp-cli[speedups]``, not available on Windows); when it is not installed
+the standard asyncio loop is used instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on optional dependency
+    uvloop = None  # type: ignore[assignment]
+
+_T = TypeVar("_T")
+
+
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return a factory for uvloop event loops, or ``None`` to use asyncio's.
+
+    The result is meant for ``asyncio.Runner(loop_factory=...)``.
+    """
+
+    return uvloop.new_event_loop if uvloop is not None else None
+
+
+def run(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run ``coro`` like :func:`asyncio.run`, on a uvloop loop when available."""
+
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
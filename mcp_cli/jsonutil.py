@@ -0,0 +1,64 @@
+"""JSON helpers that prefer the optional ``orjson`` package.
+
+``orjson`` parses directly from bytes and serializes straight to bytes in C,
+and is noticeably faster than the standard library for the payloads handled
+by mcp-tool. It is an optional dependency (``mcp-cli[speedups]``); when it is
+not installed the stdlib :mod:`json` module is used instead.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional dependency
+    orjson = None  # type: ignore[assignment]
+
+# ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+# can catch this single exception type regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+# ``orjson`` parses integers outside the 64-bit range as floats, silently
+# losing precision. Any run of 19 digits may be such an integer, and those
+# documents are handed to the stdlib parser, which keeps the exact value.
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from ``str`` or UTF-8 encoded ``bytes``.
+
+    Raises:
+        JSONDecodeError: If ``data`` is not valid JSON.
+    """
+
+    if orjson is not None:
+        if isinstance(data, bytes):
+            long_digits = _LONG_DIGITS_BYTES.search(data)
+        else:
+            long_digits = _LONG_DIGITS.search(data)
+        if long_digits is None:
+            return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``value`` to UTF-8 encoded JSON.
+
+    Args:
+        value: JSON-compatible object to serialize.
+        indent: Pretty-print with two-space indentation.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(value, option=option)
+        except TypeError:
+            # Raised for integers beyond 64 bits, which the stdlib handles.
+            pass
+    text = json.dumps(value, ensure_ascii=False, indent=2 if indent else None)
+    return text.encode("utf-8")
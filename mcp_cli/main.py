@@ -2,31 +2,155 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
+import atexit
+import contextlib
+import functools
+import os
 import sys
+from collections.abc import Callable, Coroutine, MutableMapping
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import click
-import mcp.types as types
-from rich.console import Console
-from rich.syntax import Syntax
 
-from .client import McpServerClient, ToolDescriptor, discover_tools, discover_tools_for_server
-from .config import ConfigError, ConfigNotFoundError, MergedConfig, load_merged_config
+from . import jsonutil
+from .config import (
+    ConfigError,
+    ConfigNotFoundError,
+    MergedConfig,
+    ServerConfig,
+    env_flag,
+    load_merged_config,
+)
 from .schema import build_property_specs
+from .tool_cache import ToolCache
+
+if TYPE_CHECKING:
+    # Importing the MCP SDK costs hundreds of milliseconds, and asyncio with
+    # the client and daemon modules tens more; they are only needed at
+    # runtime once servers are actually contacted.
+    import mcp.types as types
+
+    from .client import ClientPool
+    from .descriptors import ToolDescriptor
 
+_T = TypeVar("_T")
 
-class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
-    """Dynamic CLI that exposes MCP tools as subcommands."""
+# Set to a truthy value to list tools from the on-disk cache only, without
+# starting servers that have no cached tool list (e.g. for shell completion).
+NO_DISCOVER_ENV = "MCP_TOOL_NO_DISCOVER"
+
+
+class McpToolCLI(click.Group):
+    """Dynamic CLI that exposes MCP tools as subcommands.
+
+    Tool commands are built on first use and registered with
+    :meth:`click.Group.add_command`, so ``self.commands`` holds the commands
+    built so far rather than a static list.
+    """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._merged_config: MergedConfig | None = None
         self._tool_descriptors: list[ToolDescriptor] | None = None
+        # Discovered tools keyed by their ``<server>__<tool>`` command name.
+        self._tool_index: dict[str, ToolDescriptor] = {}
+        # ``(name, short help)`` rows for the root help, built on first render.
+        self._short_help_rows: list[tuple[str, str]] | None = None
         self._config_error: Exception | None = None
+        self._tool_cache = ToolCache()
+        self._cached_servers: set[str] = set()
+        # Servers left out of the listing because discovery was disabled.
+        self._undiscovered_servers: list[str] = []
+        # Set when only cached tool lists may be used (shell completion and
+        # ``mcp-tool help``), so that no server is started.
+        self._cache_only = False
+        # ``asyncio.Runner`` on Python 3.11+, created on first use.
+        self._runner: Any = None
+        self._pool: ClientPool | None = None
+
+    def run_async(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run ``coro`` on the event loop shared by this CLI process.
+
+        Discovery and tool execution reuse a single loop instead of creating
+        and tearing one down per :func:`asyncio.run` call. Python 3.10 has no
+        ``asyncio.Runner`` and falls back to :func:`asyncio.run`. The loop is
+        a uvloop loop when ``uvloop`` is installed.
+        """
+
+        from . import eventloop
+
+        if sys.version_info < (3, 11):
+            return eventloop.run(coro)
+
+        if self._runner is None:
+            import asyncio
+
+            self._runner = asyncio.Runner(loop_factory=eventloop.loop_factory())
+            atexit.register(self._close_runner)
+        return self._runner.run(coro)
+
+    def session_pool(self) -> ClientPool | None:
+        """Return the pool of sessions kept open for this CLI process.
+
+        Sessions outlive a single :meth:`run_async` call only when the loop is
+        shared, so there is no pool on Python 3.10.
+        """
+
+        if sys.version_info < (3, 11):
+            return None
+        if self._pool is None:
+            from .client import ClientPool
+
+            self._pool = ClientPool()
+        return self._pool
+
+    def _close_runner(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            with contextlib.suppress(Exception):
+                self._runner.run(pool.aclose())
+        self._runner.close()
+
+    def _main_shell_completion(
+        self,
+        ctx_args: MutableMapping[str, Any],
+        prog_name: str,
+        complete_var: str | None = None,
+    ) -> None:
+        """Answer shell completion from cached tool lists only.
+
+        The shell runs the CLI on every <Tab>, so completion must never start
+        MCP servers; servers without a cached tool list are simply not offered.
+        Click calls this on every run, so cache-only mode is enabled only when
+        the completion variable is actually set.
+        """
+
+        if complete_var is None:
+            # Derived the same way as in click.Command._main_shell_completion.
+            complete_name = prog_name.replace("-", "_").replace(".", "_")
+            complete_var = f"_{complete_name}_COMPLETE".upper()
+
+        if os.environ.get(complete_var):
+            self._cache_only = True
+        super()._main_shell_completion(ctx_args, prog_name, complete_var)
+
+    def _discovery_disabled(self) -> bool:
+        return self._cache_only or env_flag(NO_DISCOVER_ENV)
+
+    def refresh_tool_cache(self) -> None:
+        """Ignore cached tool lists and re-discover tools from the servers."""
+
+        self._tool_cache.refresh()
+
+    def _set_tool_descriptors(self, descriptors: list[ToolDescriptor]) -> None:
+        self._tool_descriptors = descriptors
+        self.commands.clear()
+        self._short_help_rows = None
+        self._tool_index = {
+            f"{tool.server_name}__{tool.tool_name}": tool for tool in descriptors
+        }
 
     def _load_config(self) -> MergedConfig | None:
         """Load and cache the merged configuration with user-facing errors.
@@ -50,7 +174,13 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
         return merged_config
 
     def _ensure_discovery(self) -> None:
-        """Load configuration and discover tools if not already done."""
+        """Load configuration and discover tools if not already done.
+
+        Tool lists are taken from the on-disk cache where possible, so only
+        servers without a valid cache entry are started. With
+        ``MCP_TOOL_NO_DISCOVER`` set, during shell completion and for
+        ``mcp-tool help``, those servers are not started either.
+        """
 
         if self._tool_descriptors is not None or self._config_error is not None:
             return
@@ -59,8 +189,26 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
         if merged_config is None:
             return
 
+        # Only servers without a cached tool list are started.
+        cached: list[ToolDescriptor] = []
+        uncached: dict[str, ServerConfig] = {}
+        for name, server_config in merged_config.servers.items():
+            server_tools = self._tool_cache.get(server_config)
+            if server_tools is None:
+                uncached[name] = server_config
+            else:
+                cached.extend(server_tools)
+                self._cached_servers.add(name)
+
+        if not uncached or self._discovery_disabled():
+            self._undiscovered_servers = list(uncached)
+            self._set_tool_descriptors(cached)
+            return
+
+        from .client import discover_tools
+
         try:
-            descriptors = asyncio.run(discover_tools(merged_config))
+            discovered = self.run_async(discover_tools(MergedConfig(servers=uncached)))
         except Exception as exc:  # pragma: no cover - unexpected runtime failure
             click.echo(
                 click.style(f"Error during tool discovery: {exc}", fg="red"),
@@ -69,17 +217,23 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
             self._config_error = exc
             return
 
+        self._tool_cache.store(uncached.values(), discovered)
         self._merged_config = merged_config
-        self._tool_descriptors = descriptors
+        self._set_tool_descriptors(cached + discovered)
 
-    def _ensure_discovery_for_server(self, server_name: str) -> None:
+    def _ensure_discovery_for_server(
+        self, server_name: str, *, use_cache: bool = True
+    ) -> None:
         """Load configuration and discover tools for a single server.
 
         This is used by get_command to avoid starting unrelated MCP servers
-        when invoking a specific tool subcommand.
+        when invoking a specific tool subcommand. With ``use_cache=False`` the
+        server is queried even when tools were already loaded or cached.
         """
 
-        if self._tool_descriptors is not None or self._config_error is not None:
+        if self._config_error is not None:
+            return
+        if use_cache and self._tool_descriptors is not None:
             return
 
         merged_config = self._load_config()
@@ -91,8 +245,31 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
             self._config_error = ConfigNotFoundError(message)
             return
 
+        server_config = merged_config.servers[server_name]
+        if use_cache:
+            cached = self._tool_cache.get(server_config)
+            if cached is not None:
+                self._set_tool_descriptors(cached)
+                self._cached_servers.add(server_name)
+                return
+
+        if self._cache_only:
+            if self._tool_descriptors is None:
+                self._set_tool_descriptors([])
+            return
+
+        from .client import discover_tools_for_server
+
+        # Discover through a pooled session when possible, so that a tool call
+        # that follows reuses it instead of starting the server again.
+        pool = self.session_pool()
         try:
-            descriptors = asyncio.run(discover_tools_for_server(merged_config, server_name))
+            if pool is not None:
+                descriptors = self.run_async(pool.list_tools(server_config))
+            else:
+                descriptors = self.run_async(
+                    discover_tools_for_server(merged_config, server_name)
+                )
         except Exception as exc:  # pragma: no cover - unexpected runtime failure
             click.echo(
                 click.style(f"Error during tool discovery: {exc}", fg="red"),
@@ -101,7 +278,16 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
             self._config_error = exc
             return
 
-        self._tool_descriptors = descriptors
+        self._tool_cache.store([server_config], descriptors)
+        if not use_cache and self._tool_descriptors:
+            others = [
+                tool
+                for tool in self._tool_descriptors
+                if tool.server_name != server_name
+            ]
+            descriptors = others + descriptors
+        self._set_tool_descriptors(descriptors)
+        self._cached_servers.discard(server_name)
 
     def list_commands(self, ctx: click.Context) -> list[str]:  # type: ignore[override]
         """Return all available subcommand names.
@@ -111,11 +297,7 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
         """
 
         self._ensure_discovery()
-        if not self._tool_descriptors:
-            return []
-
-        names = [f"{tool.server_name}__{tool.tool_name}" for tool in self._tool_descriptors]
-        return sorted(set(names))
+        return sorted(self._tool_index)
 
     def get_command(self, ctx: click.Context, name: str) -> click.Command | None:  # type: ignore[override]
         """Return a click command for the given subcommand name."""
@@ -134,7 +316,13 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
                     raise click.ClickException("Internal error: missing parent context for help command.")
 
                 if not command_name:
-                    click.echo(parent_ctx.get_help())
+                    # The root help lists cached tools only; `--help` still
+                    # discovers servers whose tools are not cached yet.
+                    self._cache_only = True
+                    try:
+                        click.echo(parent_ctx.get_help())
+                    finally:
+                        self._cache_only = False
                     return
 
                 cmd = self.get_command(parent_ctx, command_name)
@@ -146,6 +334,11 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
 
             return _help_command
 
+        # Click resolves the same name several times per invocation.
+        built_command = self.commands.get(name)
+        if built_command is not None:
+            return built_command
+
         server_name: str | None = None
         if "__" in name:
             server_name = name.split("__", 1)[0]
@@ -163,11 +356,11 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
         if not self._tool_descriptors or self._merged_config is None:
             return None
 
-        target_tool: ToolDescriptor | None = None
-        for descriptor in self._tool_descriptors:
-            if f"{descriptor.server_name}__{descriptor.tool_name}" == name:
-                target_tool = descriptor
-                break
+        target_tool = self._tool_index.get(name)
+        if target_tool is None and server_name in self._cached_servers:
+            # The server may have gained the tool since it was cached.
+            self._ensure_discovery_for_server(server_name, use_cache=False)
+            target_tool = self._tool_index.get(name)
 
         if target_tool is None:
             return None
@@ -176,21 +369,45 @@ class McpToolCLI(click.MultiCommand):  # type: ignore[misc]
         if server_config is None:
             return None
 
-        return _build_tool_command(name, server_config.name, target_tool.tool_name, target_tool)
+        cmd = _build_tool_command(
+            name,
+            server_config,
+            target_tool.tool_name,
+            target_tool,
+            run_async=self.run_async,
+            get_pool=self.session_pool,
+        )
+        self.add_command(cmd, name)
+        return cmd
 
     def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:  # type: ignore[override]
         """Render the list of available MCP tools in the help output."""
 
         commands = self.list_commands(ctx)
-        if not commands:
-            return
 
-        rows: list[tuple[str, str]] = []
-        for name in commands:
-            cmd = self.get_command(ctx, name)
-            if cmd is None:
-                continue
-            rows.append((name, cmd.get_short_help_str()))
+        # Rows come straight from the descriptors; building every tool
+        # command just to read its short help would parse every schema, so a
+        # bare command carries only the help text. They are computed once per
+        # discovery result and reused by later renders.
+        if self._short_help_rows is None:
+            self._short_help_rows = [
+                (
+                    name,
+                    click.Command(
+                        name, help=_tool_description(self._tool_index[name])
+                    ).get_short_help_str(),
+                )
+                for name in commands
+            ]
+
+        rows = list(self._short_help_rows)
+
+        if env_flag(NO_DISCOVER_ENV):
+            hint = f"Tools not cached yet; unset {NO_DISCOVER_ENV} to discover them."
+        else:
+            hint = "Tools not cached yet; run 'mcp-tool --help' to discover them."
+        for server_name in self._undiscovered_servers:
+            rows.append((f"{server_name}__*", hint))
 
         if rows:
             with formatter.section(click.style("Available MCP Tools", fg="cyan", bold=True)):
@@ -208,6 +425,7 @@ class ToolCommand(click.Command):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._schema_param_names: set[str] = set()
+        self._input_schema: dict[str, Any] | None = None
         self._input_schema_text: str | None = None
 
     def set_schema_param_names(self, names: set[str]) -> None:
@@ -215,10 +433,25 @@ class ToolCommand(click.Command):
 
         self._schema_param_names = set(names)
 
-    def set_input_schema_text(self, text: str) -> None:
-        """Attach pretty-printed JSON Schema text for help rendering."""
+    def set_input_schema(self, schema: dict[str, Any]) -> None:
+        """Attach the tool's JSON Schema for help rendering.
+
+        The schema is only pretty-printed when help is actually rendered, so
+        building commands for the root tool listing does not pay for it.
+        """
 
-        self._input_schema_text = text
+        self._input_schema = schema
+        self._input_schema_text = None
+
+    @property
+    def input_schema_text(self) -> str | None:
+        """Return the pretty-printed input schema, or ``None`` if it is empty."""
+
+        if self._input_schema_text is None and self._input_schema:
+            self._input_schema_text = jsonutil.dumps(
+                self._input_schema, indent=True
+            ).decode("utf-8")
+        return self._input_schema_text
 
     def format_options(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:  # type: ignore[override]
         """Render Parameters and Options sections separately.
@@ -252,44 +485,80 @@ class ToolCommand(click.Command):
 
         super().format_help(ctx, formatter)
 
-        if self._input_schema_text:
+        schema_text = self.input_schema_text
+        if schema_text:
             with formatter.section(click.style("Input schema", fg="magenta", bold=True)):
-                for line in _format_json_schema_with_rich(self._input_schema_text):
+                for line in _format_json_schema_with_rich(schema_text):
                     formatter.write_text(line)
 
 
-def _format_json_schema_with_rich(schema_text: str) -> list[str]:
+def _format_json_schema_with_rich(schema_text: str) -> tuple[str, ...]:
     """Format JSON schema text with rich syntax highlighting when appropriate.
 
     When stdout is not a TTY, the original plain-text lines are returned to
-    avoid leaking ANSI color codes into redirected or captured output.
+    avoid leaking ANSI color codes into redirected or captured output. The
+    same applies when ``NO_COLOR`` is set or the terminal is ``dumb``.
     """
 
+    if os.environ.get("NO_COLOR") or os.environ.get("TERM") == "dumb":
+        return _highlight_json_lines(schema_text, False)
+
     try:
-        if not sys.stdout.isatty():
-            return schema_text.splitlines()
+        is_tty = sys.stdout.isatty()
     except Exception:
-        return schema_text.splitlines()
+        is_tty = False
+    return _highlight_json_lines(schema_text, is_tty)
+
+
+@functools.lru_cache(maxsize=128)
+def _highlight_json_lines(schema_text: str, is_tty: bool) -> tuple[str, ...]:
+    """Memoized worker for :func:`_format_json_schema_with_rich`.
+
+    Highlighting lexes the whole schema with Pygments, so repeated help
+    renders of the same schema reuse the first result.
+    """
+
+    if not is_tty:
+        return tuple(schema_text.splitlines())
+
+    # rich's Console and Syntax (and Pygments) are only needed here.
+    from rich.console import Console
+    from rich.syntax import Syntax
 
     buffer = StringIO()
     console = Console(file=buffer, force_terminal=True, color_system="auto")
     syntax = Syntax(schema_text, "json", word_wrap=False, theme="ansi_light")
     console.print(syntax)
     value = buffer.getvalue()
-    return value.splitlines()
+    return tuple(value.splitlines())
+
+
+def _tool_description(descriptor: ToolDescriptor) -> str:
+    """Return the help description for a tool, with a generic fallback."""
+
+    return (
+        descriptor.description
+        or f"Execute tool '{descriptor.tool_name}' on server "
+        f"'{descriptor.server_name}'."
+    )
 
 
 def _build_tool_command(
     command_name: str,
-    server_name: str,
+    server_config: ServerConfig,
     tool_name: str,
     descriptor: ToolDescriptor,
+    run_async: Callable[[Coroutine[Any, Any, None]], None] | None = None,
+    get_pool: Callable[[], ClientPool | None] | None = None,
 ) -> click.Command:
     """Create a click command that invokes the given MCP tool.
 
     The generated command supports JSON-based argument passing and, when the
     tool input schema is simple enough, also exposes individual fields as
-    dedicated CLI flags.
+    dedicated CLI flags. The tool call is executed through ``run_async``
+    (:func:`mcp_cli.eventloop.run` by default), using a session from the pool
+    returned by ``get_pool`` when one is given. Both are only used once the
+    command runs, so building a command for help output stays cheap.
     """
 
     property_specs = build_property_specs(descriptor.input_schema)
@@ -315,15 +584,21 @@ def _build_tool_command(
         # CLI flags override JSON-provided arguments for the same fields.
         arguments.update(flag_args)
 
+        if run_async is None:
+            from .eventloop import run as runner
+        else:
+            runner = run_async
+        pool = get_pool() if get_pool is not None else None
+
         try:
-            asyncio.run(_run_tool(server_name, tool_name, arguments, output))
+            runner(_run_tool(server_config, tool_name, arguments, output, pool=pool))
         except ConfigError as exc:
             raise click.ClickException(str(exc)) from exc
         except Exception as exc:  # pragma: no cover - unexpected runtime errors
             raise click.ClickException(f"Tool execution failed: {exc}") from exc
 
-    # Apply dynamic options for schema-derived properties first, then generic options.
-    cmd: click.Command = click.command(name=command_name, cls=ToolCommand)(_command)
+    # Schema-derived options come first, followed by the generic options.
+    params: list[click.Parameter] = []
     schema_param_names: set[str] = set()
 
     for spec in property_specs:
@@ -341,59 +616,57 @@ def _build_tool_command(
         elif spec.type == "boolean":
             # Boolean flags are exposed as --name/--no-name style switches.
             schema_param_names.add(spec.name)
-            cmd = click.option(
-                f"--{spec.name}/--no-{spec.name}",
-                default=False,
-                help=spec.description or "",
-            )(cmd)
+            params.append(
+                click.Option(
+                    [f"--{spec.name}/--no-{spec.name}"],
+                    default=False,
+                    help=spec.description or "",
+                )
+            )
             continue
         else:
             option_kwargs["type"] = str
 
         schema_param_names.add(spec.param_name)
-        cmd = click.option(spec.cli_flag, spec.param_name, **option_kwargs)(cmd)
+        params.append(click.Option([spec.cli_flag, spec.param_name], **option_kwargs))
 
     # Generic JSON and output options.
-    cmd = click.option(
-        "--output",
-        "output",
-        type=click.Choice(["text", "json"], case_sensitive=False),
-        default="text",
-        show_default=True,
-        help="Output format for tool results.",
-    )(cmd)
-    cmd = click.option(
-        "--json-stdin",
-        "json_stdin",
-        is_flag=True,
-        default=False,
-        help="Read JSON arguments from standard input.",
-    )(cmd)
-    cmd = click.option(
-        "--json-file",
-        "json_file",
-        type=click.Path(path_type=Path, exists=True, dir_okay=False, readable=True),
-        required=False,
-        help="Path to a JSON file containing arguments.",
-    )(cmd)
-    cmd = click.option(
-        "--json",
-        "json",
-        type=str,
-        required=False,
-        help="Inline JSON arguments for the tool.",
-    )(cmd)
-
-    # Mark schema-derived parameters so that ToolCommand can render them in a
-    # dedicated Parameters section.
-    if isinstance(cmd, ToolCommand):
-        cmd.set_schema_param_names(schema_param_names)
+    params.extend(
+        [
+            click.Option(
+                ["--output", "output"],
+                type=click.Choice(["text", "json"], case_sensitive=False),
+                default="text",
+                show_default=True,
+                help="Output format for tool results.",
+            ),
+            click.Option(
+                ["--json-stdin", "json_stdin"],
+                is_flag=True,
+                default=False,
+                help="Read JSON arguments from standard input.",
+            ),
+            click.Option(
+                ["--json-file", "json_file"],
+                type=click.Path(
+                    path_type=Path, exists=True, dir_okay=False, readable=True
+                ),
+                required=False,
+                help="Path to a JSON file containing arguments.",
+            ),
+            click.Option(
+                ["--json", "json"],
+                type=str,
+                required=False,
+                help="Inline JSON arguments for the tool.",
+            ),
+        ]
+    )
 
     # Enrich the command help with the original tool description. The input
     # schema itself is rendered via ToolCommand.format_help to preserve
     # newlines and indentation.
-    description = descriptor.description or f"Execute tool '{tool_name}' on server '{server_name}'."
-    help_parts = [description]
+    help_parts = [_tool_description(descriptor)]
     if property_specs:
         help_parts.append(
             "Simple input fields are available as CLI flags when possible. "
@@ -402,13 +675,17 @@ def _build_tool_command(
     else:
         help_parts.append("Arguments should be provided as JSON via --json, --json-file or --json-stdin.")
 
-    help_text = "\n\n".join(help_parts)
-    cmd.help = help_text
-    cmd.__doc__ = help_text
-    if isinstance(cmd, ToolCommand):
-        schema_text = json.dumps(descriptor.input_schema, ensure_ascii=False, indent=2)
-        if schema_text and schema_text != "{}":
-            cmd.set_input_schema_text(schema_text)
+    cmd = ToolCommand(
+        name=command_name,
+        callback=_command,
+        params=params,
+        help="\n\n".join(help_parts),
+    )
+
+    # Mark schema-derived parameters so that ToolCommand can render them in a
+    # dedicated Parameters section.
+    cmd.set_schema_param_names(schema_param_names)
+    cmd.set_input_schema(descriptor.input_schema)
     return cmd
 
 
@@ -423,15 +700,16 @@ def _parse_json_arguments(
     provided. When none are provided, an empty argument object is used.
     """
 
-    sources_provided = sum(bool(value) for value in (json_arg, json_file, json_stdin))
+    sources_provided = bool(json_arg) + (json_file is not None) + json_stdin
     if sources_provided > 1:
         raise ValueError("Only one of --json, --json-file or --json-stdin may be used at a time.")
 
-    raw: str | None = None
+    # Files and stdin are read as bytes and parsed without decoding to str.
+    raw: str | bytes | None = None
     if json_stdin:
-        raw = sys.stdin.read()
+        raw = click.get_binary_stream("stdin").read()
     elif json_file is not None:
-        raw = json_file.read_text(encoding="utf-8")
+        raw = json_file.read_bytes()
     elif json_arg is not None:
         raw = json_arg
 
@@ -439,8 +717,8 @@ def _parse_json_arguments(
         return {}
 
     try:
-        value = json.loads(raw)
-    except json.JSONDecodeError as exc:  # pragma: no cover - trivial error path
+        value = jsonutil.loads(raw)
+    except jsonutil.JSONDecodeError as exc:  # pragma: no cover - trivial error path
         raise ValueError("Failed to parse JSON arguments.") from exc
 
     if not isinstance(value, dict):
@@ -449,21 +727,40 @@ def _parse_json_arguments(
     return value
 
 
-async def _run_tool(server_name: str, tool_name: str, arguments: dict[str, Any], output: str) -> None:
-    """Execute a single tool call and print its result."""
+async def _run_tool(
+    server_config: ServerConfig,
+    tool_name: str,
+    arguments: dict[str, Any],
+    output: str,
+    *,
+    pool: ClientPool | None = None,
+) -> None:
+    """Execute a single tool call and print its result.
+
+    ``server_config`` comes from the configuration already loaded by the CLI,
+    so the config files are not parsed a second time. With a ``pool``, the
+    session opened during discovery of the server is reused.
+    """
 
-    merged = load_merged_config()
-    server_config = merged.servers.get(server_name)
-    if server_config is None:
-        message = f"Server '{server_name}' is not defined in configuration."
-        raise ConfigNotFoundError(message)
+    from .client import McpServerClient
+    from .daemon import DAEMON_ENV, call_tool_via_daemon
 
-    client = McpServerClient(server_config)
-    try:
-        await client.initialize()
-        result = await client.call_tool(tool_name, arguments)
-    finally:
-        await client.cleanup()
+    result: types.CallToolResult | None = None
+    if env_flag(DAEMON_ENV):
+        # Reuse a long-lived session held by the daemon; fall back to a
+        # one-off session when the daemon cannot be started.
+        result = await call_tool_via_daemon(server_config, tool_name, arguments)
+
+    if result is None and pool is not None:
+        result = await pool.call_tool(server_config, tool_name, arguments)
+
+    if result is None:
+        client = McpServerClient(server_config)
+        try:
+            await client.initialize()
+            result = await client.call_tool(tool_name, arguments)
+        finally:
+            await client.cleanup()
 
     _print_result(result, output)
 
@@ -472,22 +769,48 @@ def _print_result(result: types.CallToolResult, output: str) -> None:
     """Print tool results in the requested format."""
 
     if output.lower() == "json":
-        click.echo(json.dumps(result, ensure_ascii=False, indent=2))
+        payload = result.model_dump(mode="json", by_alias=True, exclude_none=True)
+        # Echoing bytes writes them to the binary stdout stream as-is.
+        click.echo(jsonutil.dumps(payload, indent=True))
         return
 
     if not result.content:
         return
 
-    for block in result.content:
-        if isinstance(block, types.TextContent):
-            click.echo(block.text.replace("\n\n", "\n"), nl=True)
+    # Blocks are normalized individually and written with a single echo;
+    # the output matches one echo per block. Content blocks are told apart
+    # by their ``type`` discriminator, so mcp.types need not be imported.
+    texts = [
+        block.text.replace("\n\n", "\n")
+        for block in result.content
+        if block.type == "text"
+    ]
+    if texts:
+        click.echo("\n".join(texts))
+
+
+def _refresh_cache_callback(
+    ctx: click.Context, param: click.Parameter, value: bool
+) -> None:
+    if value and isinstance(ctx.command, McpToolCLI):
+        ctx.command.refresh_tool_cache()
 
 
 cli = McpToolCLI(
     help=(
         "Expose MCP servers' tools as local CLI subcommands. "
         "Configure servers via mcp.json, .claude/mcp.json or ~/.mcp.json."
-    )
+    ),
+    params=[
+        click.Option(
+            ["--refresh-cache", "--refresh"],
+            is_flag=True,
+            is_eager=True,
+            expose_value=False,
+            callback=_refresh_cache_callback,
+            help="Ignore cached tool lists and query the MCP servers again.",
+        )
+    ],
 )
 
 
@@ -496,21 +819,21 @@ def _rewrite_args_for_help(argv: list[str]) -> list[str]:
 
     Supported patterns:
 
-    * ``mcp-tool help`` → ``mcp-tool --help``
     * ``mcp-tool help <command>`` → ``mcp-tool <command> --help``
     * ``mcp-tool <command> help`` → ``mcp-tool <command> --help``
+
+    A bare ``mcp-tool help`` is left to the ``help`` subcommand, which renders
+    the root help from cached tool lists without starting servers.
     """
 
     if not argv:
         return argv
 
-    if argv[0] == "help":
-        if len(argv) == 1:
-            return ["--help"]
-        return [argv[1]] + ["--help"] + argv[2:]
+    if argv[0] == "help" and len(argv) >= 2:
+        return [argv[1], "--help", *argv[2:]]
 
     if len(argv) >= 2 and argv[-1] == "help":
-        return argv[:-1] + ["--help"]
+        return [*argv[:-1], "--help"]
 
     return argv
 
@@ -7,11 +7,12 @@ JSON-based argument passing mode.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropertySpec:
     """Specification for exposing a JSON Schema property as a CLI option.
 
@@ -34,7 +35,13 @@ class PropertySpec:
     description: str | None = None
 
 
-_RESERVED_PARAM_NAMES: set[str] = {"json", "json_file", "json_stdin", "output"}
+_RESERVED_PARAM_NAMES = frozenset({"json", "json_file", "json_stdin", "output"})
+
+# JSON Schema types that map to a single CLI option, mapped to the canonical
+# (interned literal) string so that specs never hold per-schema copies.
+_SCALAR_TYPES: dict[str, str] = {
+    name: name for name in ("string", "integer", "number", "boolean")
+}
 
 
 def build_property_specs(schema: dict[str, Any]) -> list[PropertySpec]:
@@ -63,9 +70,12 @@ def build_property_specs(schema: dict[str, Any]) -> list[PropertySpec]:
     if not isinstance(properties, dict):
         return []
 
-    required_props = schema.get("required", [])
-    if not isinstance(required_props, list):
-        required_props = []
+    required_value = schema.get("required")
+    required_props = (
+        frozenset(name for name in required_value if isinstance(name, str))
+        if isinstance(required_value, list)
+        else frozenset()
+    )
 
     specs: list[PropertySpec] = []
 
@@ -79,23 +89,25 @@ def build_property_specs(schema: dict[str, Any]) -> list[PropertySpec]:
             continue
 
         prop_type_value = prop_schema.get("type")
-        if isinstance(prop_type_value, list):
+        if isinstance(prop_type_value, str):
+            prop_type = _SCALAR_TYPES.get(prop_type_value)
+            if prop_type is None:
+                # Arrays and objects are currently left to JSON-based arguments.
+                continue
+        elif isinstance(prop_type_value, list):
             # If multiple types are allowed, we only handle the simple case
             # where exactly one of the supported scalar types is present.
-            scalar_types = {"string", "integer", "number", "boolean"}
-            candidates = [t for t in prop_type_value if t in scalar_types]
+            candidates = [
+                _SCALAR_TYPES[t]
+                for t in prop_type_value
+                if isinstance(t, str) and t in _SCALAR_TYPES
+            ]
             if len(candidates) != 1:
                 continue
             prop_type = candidates[0]
-        elif isinstance(prop_type_value, str):
-            prop_type = prop_type_value
         else:
             continue
 
-        if prop_type not in {"string", "integer", "number", "boolean"}:
-            # Arrays and objects are currently left to JSON-based arguments.
-            continue
-
         description = prop_schema.get("description")
         if not isinstance(description, str):
             description = None
@@ -109,12 +121,14 @@ def build_property_specs(schema: dict[str, Any]) -> list[PropertySpec]:
 
         is_required = raw_name in required_props
 
-        param_name = raw_name
-        cli_flag = f"--{raw_name}"
+        # Names become Click parameter names and keyword argument keys.
+        name = sys.intern(raw_name)
+        param_name = name
+        cli_flag = f"--{name}"
 
         specs.append(
             PropertySpec(
-                name=raw_name,
+                name=name,
                 param_name=param_name,
                 cli_flag=cli_flag,
                 type=prop_type,
@@ -0,0 +1,218 @@
+"""Persistent cache of discovered tool descriptors.
+
+Listing tools requires starting every MCP server, which dominates the cost
+of ``mcp-tool --help`` and of resolving a tool subcommand. Discovery results
+are therefore stored in ``tools.json`` under the mcp-tool cache directory and
+reused for ``MCP_TOOL_CACHE_TTL`` seconds (one hour by default; ``0``
+disables the cache).
+
+Entries are keyed by a hash of the server configuration, the working
+directory and the modification time of the server executable, so editing a
+server definition, running from another project or upgrading the server
+binary never reuses a stale tool list. ``MCP_TOOL_REFRESH=1`` (or
+``--refresh``) ignores existing entries for one invocation.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, TypeGuard
+
+from . import jsonutil
+from .cache import get_cache_dir, write_bytes_atomic
+from .config import ServerConfig, env_flag, find_executable
+from .descriptors import ToolDescriptor
+
+# Seconds a cached tool list stays valid; ``0`` disables the cache.
+TOOL_CACHE_TTL_ENV = "MCP_TOOL_CACHE_TTL"
+DEFAULT_TOOL_CACHE_TTL = 3600.0
+
+# Set to a truthy value to ignore cached tool lists, like ``--refresh``.
+TOOL_REFRESH_ENV = "MCP_TOOL_REFRESH"
+
+TOOL_CACHE_FILENAME = "tools.json"
+_TOOL_CACHE_VERSION = 1
+
+
+def get_tool_cache_ttl() -> float:
+    """Return the configured tool cache TTL in seconds."""
+
+    raw_ttl = os.environ.get(TOOL_CACHE_TTL_ENV)
+    if not raw_ttl:
+        return DEFAULT_TOOL_CACHE_TTL
+    try:
+        return max(float(raw_ttl), 0.0)
+    except ValueError:
+        return DEFAULT_TOOL_CACHE_TTL
+
+
+def _command_mtime_ns(server_config: ServerConfig) -> int | None:
+    """Return the mtime of a stdio server's executable, if it can be found."""
+
+    if server_config.type.lower() == "http" or not server_config.command:
+        return None
+
+    # Resolved the same way, and through the same memo, as when the server
+    # is started.
+    executable = find_executable(server_config.command)
+    if executable is None:
+        return None
+    try:
+        return os.stat(executable).st_mtime_ns
+    except OSError:
+        return None
+
+
+def server_cache_key(server_config: ServerConfig, cwd: str | Path | None = None) -> str:
+    """Return the cache key for tools discovered from ``server_config``."""
+
+    identity = {
+        "server": dataclasses.asdict(server_config),
+        "cwd": str(cwd if cwd is not None else os.getcwd()),
+        "command_mtime_ns": _command_mtime_ns(server_config),
+    }
+    encoded = json.dumps(identity, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+class ToolCache:
+    """Read-through store of tool descriptors keyed by server configuration.
+
+    The cache file is read at most once per instance and rewritten only when
+    new discovery results are stored.
+    """
+
+    def __init__(self, ttl: float | None = None, path: Path | None = None) -> None:
+        self._ttl = get_tool_cache_ttl() if ttl is None else ttl
+        # Resolved on use, so that a cache created at import time follows
+        # later changes to ``XDG_CACHE_HOME``.
+        self._path = path
+        self._entries: dict[str, Any] | None = None
+        self._refresh = env_flag(TOOL_REFRESH_ENV)
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether caching is enabled."""
+
+        return self._ttl > 0
+
+    def get(self, server_config: ServerConfig) -> list[ToolDescriptor] | None:
+        """Return cached descriptors for ``server_config``, or ``None`` on a miss."""
+
+        if not self.enabled or self._refresh:
+            return None
+
+        entry = self._load().get(server_cache_key(server_config))
+        if not self._is_fresh(entry):
+            return None
+
+        tools = entry.get("tools")
+        if not isinstance(tools, list):
+            return None
+
+        try:
+            return [
+                ToolDescriptor(
+                    server_name=server_config.name,
+                    tool_name=tool["name"],
+                    description=tool.get("description") or "",
+                    input_schema=tool.get("input_schema") or {},
+                    title=tool.get("title"),
+                )
+                for tool in tools
+            ]
+        except (KeyError, TypeError, AttributeError):
+            return None
+
+    def store(
+        self, server_configs: Iterable[ServerConfig], descriptors: list[ToolDescriptor]
+    ) -> None:
+        """Store discovery results for ``server_configs``.
+
+        Servers without any descriptors are skipped: an empty result usually
+        means the server failed to start, and should be retried next time.
+        """
+
+        if not self.enabled:
+            return
+
+        by_server: dict[str, list[dict[str, Any]]] = {}
+        for descriptor in descriptors:
+            by_server.setdefault(descriptor.server_name, []).append(
+                {
+                    "name": descriptor.tool_name,
+                    "description": descriptor.description,
+                    "input_schema": descriptor.input_schema,
+                    "title": descriptor.title,
+                }
+            )
+
+        existing = self._load()
+        entries = {
+            key: entry for key, entry in existing.items() if self._is_fresh(entry)
+        }
+        changed = len(entries) != len(existing)
+        now = time.time()
+        for server_config in server_configs:
+            tools = by_server.get(server_config.name)
+            if tools:
+                entries[server_cache_key(server_config)] = {
+                    "created": now,
+                    "tools": tools,
+                }
+                changed = True
+
+        self._entries = entries
+        if not changed:
+            return
+
+        payload = {"version": _TOOL_CACHE_VERSION, "entries": entries}
+        try:
+            write_bytes_atomic(
+                self._file(), json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            )
+        except OSError:
+            # Caching is best effort; an unwritable cache directory only
+            # means tools are discovered again next time.
+            pass
+
+    def refresh(self) -> None:
+        """Ignore cached entries from now on; new results are still stored."""
+
+        self._refresh = True
+
+    def _file(self) -> Path:
+        return self._path or get_cache_dir() / TOOL_CACHE_FILENAME
+
+    def _is_fresh(self, entry: Any) -> TypeGuard[dict[str, Any]]:
+        if not isinstance(entry, dict):
+            return False
+        created = entry.get("created")
+        if not isinstance(created, (int, float)):
+            return False
+        return 0 <= time.time() - created < self._ttl
+
+    def _load(self) -> dict[str, Any]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            payload = jsonutil.loads(self._file().read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != _TOOL_CACHE_VERSION
+        ):
+            return {}
+        entries = payload.get("entries")
+        return entries if isinstance(entries, dict) else {}
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import mcp_cli.config as config_mod
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch: Any) -> Path:
+    """Point mcp-tool's on-disk caches at a per-test temporary directory."""
+
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture(autouse=True)
+def fresh_loaded_config(monkeypatch: Any) -> None:
+    """Start every test without a merged config memoized in-process."""
+
+    monkeypatch.setattr(config_mod, "_loaded_config", None)
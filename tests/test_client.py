@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+import mcp_cli.client as client_mod
+from mcp_cli.client import ToolDescriptor
+from mcp_cli.config import MergedConfig, ServerConfig
+
+
+class FakeClient:
+    """Stand-in for McpServerClient that never starts a real server."""
+
+    active = 0
+    max_active = 0
+    starts = 0
+
+    def __init__(self, config: ServerConfig, cwd: Any = None) -> None:
+        self._config = config
+
+    async def initialize(self) -> None:
+        FakeClient.starts += 1
+        if self._config.command == "broken":
+            raise RuntimeError("failed to start")
+        if self._config.command == "hang":
+            await asyncio.sleep(3600)
+        if self._config.command == "slow":
+            FakeClient.active += 1
+            FakeClient.max_active = max(FakeClient.max_active, FakeClient.active)
+            await asyncio.sleep(0.05)
+            FakeClient.active -= 1
+
+    async def list_tools(self) -> list[ToolDescriptor]:
+        if self._config.command == "hang_list":
+            await asyncio.sleep(3600)
+        return [
+            ToolDescriptor(
+                server_name=self._config.name,
+                tool_name="ping",
+                description="",
+                input_schema={},
+            )
+        ]
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        return f"{tool_name}:{FakeClient.starts}"
+
+    async def cleanup(self) -> None:
+        return None
+
+
+def _config(**commands: str) -> MergedConfig:
+    return MergedConfig(
+        servers={
+            name: ServerConfig(name=name, command=command)
+            for name, command in commands.items()
+        }
+    )
+
+
+def test_discover_tools_skips_failing_and_hanging_servers(monkeypatch: Any) -> None:
+    monkeypatch.setattr(client_mod, "McpServerClient", FakeClient)
+
+    async def _discover() -> list[ToolDescriptor]:
+        return await client_mod._discover_from_servers(
+            list(_config(good="ok", bad="broken", slow="hang").servers.values()),
+            timeout=0.1,
+        )
+
+    descriptors = asyncio.run(_discover())
+    assert [descriptor.server_name for descriptor in descriptors] == ["good"]
+
+
+def test_discovery_timeout_can_be_set_from_environment(monkeypatch: Any) -> None:
+    monkeypatch.setattr(client_mod, "McpServerClient", FakeClient)
+    monkeypatch.setenv(client_mod.DISCOVERY_TIMEOUT_ENV, "0.1")
+
+    descriptors = asyncio.run(
+        client_mod.discover_tools(_config(good="ok", slow="hang"))
+    )
+    assert [descriptor.server_name for descriptor in descriptors] == ["good"]
+
+
+def test_discover_tools_starts_servers_concurrently(monkeypatch: Any) -> None:
+    monkeypatch.setattr(client_mod, "McpServerClient", FakeClient)
+    monkeypatch.setattr(FakeClient, "max_active", 0)
+
+    descriptors = asyncio.run(
+        client_mod.discover_tools(_config(a="slow", b="slow", c="slow"))
+    )
+    assert [descriptor.server_name for descriptor in descriptors] == ["a", "b", "c"]
+    assert FakeClient.max_active == 3
+
+    # Server starts are bounded by MAX_CONCURRENT_DISCOVERY.
+    monkeypatch.setattr(client_mod, "MAX_CONCURRENT_DISCOVERY", 2)
+    monkeypatch.setattr(FakeClient, "max_active", 0)
+    asyncio.run(client_mod.discover_tools(_config(a="slow", b="slow", c="slow")))
+    assert FakeClient.max_active == 2
+
+
+def test_discover_tools_for_server_raises_errors(monkeypatch: Any) -> None:
+    monkeypatch.setattr(client_mod, "McpServerClient", FakeClient)
+
+    with pytest.raises(RuntimeError, match="failed to start"):
+        asyncio.run(client_mod.discover_tools_for_server(_config(bad="broken"), "bad"))
+
+
+def test_client_pool_reuses_discovery_session_for_tool_calls(monkeypatch: Any) -> None:
+    monkeypatch.setattr(client_mod, "McpServerClient", FakeClient)
+    monkeypatch.setattr(FakeClient, "starts", 0)
+    server = ServerConfig(name="good", command="ok")
+
+    async def _scenario() -> tuple[list[ToolDescriptor], Any]:
+        pool = client_mod.ClientPool()
+        try:
+            tools = await pool.list_tools(server)
+            return tools, await pool.call_tool(server, "ping", {})
+        finally:
+            await pool.aclose()
+
+    tools, result = asyncio.run(_scenario())
+    assert [tool.tool_name for tool in tools] == ["ping"]
+    assert result == "ping:1"
+
+
+def test_client_pool_list_tools_times_out_and_discards_stuck_session(
+    monkeypatch: Any,
+) -> None:
+    """A server that starts but never answers tools/list is abandoned in time."""
+
+    monkeypatch.setattr(client_mod, "McpServerClient", FakeClient)
+    server = ServerConfig(name="stuck", command="hang_list")
+
+    async def _scenario() -> None:
+        pool = client_mod.ClientPool()
+        with pytest.raises(RuntimeError, match="did not respond within 0.1 seconds"):
+            await pool.list_tools(server, timeout=0.1)
+        # Closing the pool must not wait for the abandoned request.
+        await pool.aclose()
+
+    asyncio.run(asyncio.wait_for(_scenario(), 5))
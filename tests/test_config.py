@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import mcp_cli.config as config_mod
+
+
+def _write_config(directory: Path, servers: dict[str, Any]) -> Path:
+    path = directory / "mcp.json"
+    path.write_text(json.dumps({"mcpServers": servers}), encoding="utf-8")
+    return path
+
+
+def test_load_merged_config_uses_disk_cache_until_file_changes(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    """A second load with unchanged files must not parse JSON again."""
+
+    monkeypatch.setattr(config_mod.Path, "home", lambda: tmp_path / "home")
+    _write_config(tmp_path, {"fetch": {"command": "uvx"}})
+
+    first = config_mod.load_merged_config(cwd=tmp_path)
+    assert first.servers["fetch"].command == "uvx"
+
+    calls: list[list[Path]] = []
+    original_load_raw = config_mod._load_raw_configs
+
+    def counting_load_raw(paths: list[Path]) -> Any:
+        calls.append(paths)
+        return original_load_raw(paths)
+
+    monkeypatch.setattr(config_mod, "_load_raw_configs", counting_load_raw)
+
+    # Forget the in-process result so the loads below read the on-disk cache.
+    monkeypatch.setattr(config_mod, "_loaded_config", None)
+    second = config_mod.load_merged_config(cwd=tmp_path)
+    assert second.servers["fetch"].command == "uvx"
+    assert calls == []
+
+    # Changing the file (size differs) invalidates the cached entry.
+    _write_config(tmp_path, {"fetch": {"command": "uvx", "args": ["mcp-server-fetch"]}})
+    monkeypatch.setattr(config_mod, "_loaded_config", None)
+
+    third = config_mod.load_merged_config(cwd=tmp_path)
+    assert third.servers["fetch"].args == ["mcp-server-fetch"]
+    assert len(calls) == 1
+
+    # The cache can be bypassed explicitly.
+    monkeypatch.setenv(config_mod.NO_CONFIG_CACHE_ENV, "1")
+    config_mod.load_merged_config(cwd=tmp_path)
+    assert len(calls) == 2
+
+
+def test_load_merged_config_reuses_result_within_process(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    """Repeated loads in one process skip reading the on-disk cache."""
+
+    monkeypatch.setattr(config_mod.Path, "home", lambda: tmp_path / "home")
+    _write_config(tmp_path, {"fetch": {"command": "uvx"}})
+    first = config_mod.load_merged_config(cwd=tmp_path)
+
+    def failing_read_cache(fingerprint: Any) -> Any:
+        raise AssertionError("on-disk cache must not be read")
+
+    monkeypatch.setattr(config_mod, "_read_config_cache", failing_read_cache)
+    assert config_mod.load_merged_config(cwd=tmp_path) is first
+
+
+def test_merge_server_maps_overrides_keys_and_merges_env() -> None:
+    home = {
+        "mcpServers": {
+            "fetch": {"command": "uvx", "args": ["a"], "env": {"A": "1", "B": "1"}}
+        }
+    }
+    local = {
+        "mcpServers": {
+            "fetch": {"args": ["b"], "env": {"B": "2"}},
+            "other": {"command": "npx"},
+        }
+    }
+
+    merged = config_mod._merge_server_maps(
+        [(Path("home"), home), (Path("local"), local)]
+    )
+
+    assert merged["fetch"] == {
+        "command": "uvx",
+        "args": ["b"],
+        "env": {"A": "1", "B": "2"},
+    }
+    assert merged["other"] == {"command": "npx"}
+    # The raw per-file data is left untouched.
+    assert home["mcpServers"]["fetch"]["env"] == {"A": "1", "B": "1"}
+
+
+def test_stdio_args_may_be_omitted_but_not_null() -> None:
+    assert config_mod._from_stdio("fetch", {"command": "uvx"}).args is None
+
+    with pytest.raises(config_mod.InvalidConfigError, match="invalid 'args'"):
+        config_mod._from_stdio("fetch", {"command": "uvx", "args": None})
+
+
+def test_find_executable_does_not_cache_misses_or_relative_paths_across_cwds(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setattr(config_mod, "_executable_cache", {})
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    assert config_mod.find_executable("late-server") is None
+    executable = bin_dir / "late-server"
+    executable.write_text("#!/bin/sh\n", encoding="utf-8")
+    executable.chmod(0o755)
+    assert config_mod.find_executable("late-server") == str(executable)
+
+    # A relative command is resolved against the current working directory.
+    monkeypatch.chdir(bin_dir)
+    assert config_mod.find_executable("./late-server") == "./late-server"
+    monkeypatch.chdir(tmp_path)
+    assert config_mod.find_executable("./late-server") is None
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import mcp.types as types
+import pytest
+
+import mcp_cli.client as client_mod
+import mcp_cli.daemon as daemon_mod
+from mcp_cli.config import ServerConfig
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="the daemon requires Unix domain sockets"
+)
+
+
+class CountingClient:
+    """Stand-in for McpServerClient that records how often it is started."""
+
+    starts = 0
+
+    def __init__(self, config: ServerConfig, cwd: Any = None) -> None:
+        self._config = config
+
+    async def initialize(self) -> None:
+        CountingClient.starts += 1
+
+    async def call_tool(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> types.CallToolResult:
+        text = f"{tool_name}:{arguments.get('value')}:{CountingClient.starts}"
+        return types.CallToolResult(content=[types.TextContent(type="text", text=text)])
+
+    async def cleanup(self) -> None:
+        return None
+
+
+def test_daemon_reuses_sessions_across_requests(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setattr(client_mod, "McpServerClient", CountingClient)
+    CountingClient.starts = 0
+    socket_path = tmp_path / "daemon.sock"
+    server = dataclasses.asdict(ServerConfig(name="fake", command="fake"))
+
+    async def _scenario() -> list[dict[str, Any]]:
+        serve_task = asyncio.create_task(daemon_mod.serve_forever(socket_path))
+        while not await daemon_mod._ping(socket_path):
+            await asyncio.sleep(0.01)
+
+        responses = []
+        for value in (1, 2):
+            request = {
+                "op": "call_tool",
+                "server": server,
+                "tool": "echo",
+                "arguments": {"value": value},
+            }
+            responses.append(await daemon_mod._request(socket_path, request))
+
+        await daemon_mod._request(socket_path, {"op": "shutdown"})
+        await asyncio.wait_for(serve_task, timeout=5)
+        return responses
+
+    responses = asyncio.run(_scenario())
+
+    texts = [response["result"]["content"][0]["text"] for response in responses]
+    assert texts == ["echo:1:1", "echo:2:1"]
+    assert CountingClient.starts == 1
+    assert not socket_path.exists()
+
+
+def test_daemon_exits_while_another_one_holds_the_lock(tmp_path: Path) -> None:
+    socket_path = tmp_path / "daemon.sock"
+    # Stands in for a concurrently spawned daemon that has not bound yet.
+    lock_fd = daemon_mod._acquire_daemon_lock(socket_path)
+    assert lock_fd is not None
+
+    try:
+        asyncio.run(asyncio.wait_for(daemon_mod.serve_forever(socket_path), timeout=5))
+    finally:
+        os.close(lock_fd)
+
+    assert not socket_path.exists()
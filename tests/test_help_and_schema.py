@@ -3,13 +3,17 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import click
+import pytest
 from click.testing import CliRunner
 
+import mcp_cli.client as client_mod
 import mcp_cli.config as config_mod
 import mcp_cli.main as main_mod
-from mcp_cli.client import ToolDescriptor
 from mcp_cli.config import MergedConfig, ServerConfig
+from mcp_cli.descriptors import ToolDescriptor
 from mcp_cli.main import cli
+from mcp_cli.tool_cache import ToolCache
 
 
 def test_load_merged_config_with_sample_mcp_json(
@@ -90,7 +94,7 @@ def test_help_sections_and_parameters(monkeypatch: Any) -> None:
         return [descriptor]
 
     monkeypatch.setattr(main_mod, "load_merged_config", fake_load_merged_config)
-    monkeypatch.setattr(main_mod, "discover_tools", fake_discover_tools)
+    monkeypatch.setattr(client_mod, "discover_tools", fake_discover_tools)
 
     runner = CliRunner()
 
@@ -127,3 +131,168 @@ def test_help_sections_and_parameters(monkeypatch: Any) -> None:
     result_help_cmd = runner.invoke(cli, ["help", "filesystem__read_file"])
     assert result_help_cmd.exit_code == 0
     assert "Parameters:" in result_help_cmd.output
+
+    # Built commands are registered on the group and reused.
+    ctx = click.Context(cli)
+    command = cli.get_command(ctx, "filesystem__read_file")
+    assert command is not None
+    assert cli.commands["filesystem__read_file"] is command
+    assert cli.get_command(ctx, "filesystem__read_file") is command
+
+
+@pytest.fixture
+def started_servers(monkeypatch: Any) -> list[str]:
+    """Configure servers ``cached`` and ``fetch`` and record which are started.
+
+    Every server connection goes through a stand-in for McpServerClient, so
+    both full and single-server discovery are observed.
+    """
+
+    merged = MergedConfig(
+        servers={
+            name: ServerConfig(name=name, command="uvx") for name in ("cached", "fetch")
+        }
+    )
+    started: list[str] = []
+
+    class RecordingClient:
+        def __init__(self, config: ServerConfig, cwd: Any = None) -> None:
+            self._config = config
+
+        async def initialize(self) -> None:
+            started.append(self._config.name)
+
+        async def list_tools(self) -> list[ToolDescriptor]:
+            schema = {"type": "object", "properties": {"text": {"type": "string"}}}
+            return [
+                ToolDescriptor(
+                    server_name=self._config.name,
+                    tool_name="echo",
+                    description="Echo.",
+                    input_schema=schema,
+                )
+            ]
+
+        async def cleanup(self) -> None:
+            return None
+
+    monkeypatch.setattr(main_mod, "load_merged_config", lambda cwd=None: merged)
+    monkeypatch.setattr(client_mod, "McpServerClient", RecordingClient)
+    return started
+
+
+def test_normal_invocations_discover_uncached_servers(
+    started_servers: list[str],
+) -> None:
+    """Without cache-only mode, servers missing from the cache are started."""
+
+    runner = CliRunner()
+
+    # Resolving a tool starts only its own server.
+    result = runner.invoke(
+        main_mod.McpToolCLI(help="test"),
+        ["fetch__echo", "--help"],
+        prog_name="mcp-tool",
+    )
+    assert result.exit_code == 0, result.output
+    assert "--text" in result.output
+    assert started_servers == ["fetch"]
+
+    # The root help starts the servers that are still not cached.
+    result = runner.invoke(
+        main_mod.McpToolCLI(help="test"), ["--help"], prog_name="mcp-tool"
+    )
+    assert result.exit_code == 0, result.output
+    assert "cached__echo" in result.output
+    assert "fetch__echo" in result.output
+    assert started_servers == ["fetch", "cached"]
+
+
+def test_no_discover_lists_cached_tools_without_starting_servers(
+    started_servers: list[str], monkeypatch: Any
+) -> None:
+    """With MCP_TOOL_NO_DISCOVER set, uncached servers are shown as placeholders."""
+
+    monkeypatch.setenv(main_mod.NO_DISCOVER_ENV, "1")
+    result = CliRunner().invoke(
+        main_mod.McpToolCLI(help="test"), ["--help"], prog_name="mcp-tool"
+    )
+    assert result.exit_code == 0
+    assert "fetch__*" in result.output
+    assert started_servers == []
+
+    monkeypatch.delenv(main_mod.NO_DISCOVER_ENV)
+    result = CliRunner().invoke(
+        main_mod.McpToolCLI(help="test"), ["--help"], prog_name="mcp-tool"
+    )
+    assert "fetch__echo" in result.output
+    assert sorted(started_servers) == ["cached", "fetch"]
+
+
+def test_help_subcommand_lists_cached_tools_without_starting_servers(
+    started_servers: list[str],
+) -> None:
+    """`mcp-tool help` renders the root help from cached tool lists only."""
+
+    cli_under_test = main_mod.McpToolCLI(help="test")
+    result = CliRunner().invoke(cli_under_test, ["help"], prog_name="mcp-tool")
+    assert result.exit_code == 0
+    assert "fetch__*" in result.output
+    assert "mcp-tool --help" in result.output
+    assert started_servers == []
+
+    # Only the bare help subcommand is cache-only.
+    result = CliRunner().invoke(
+        main_mod.McpToolCLI(help="test"), ["help", "fetch__echo"], prog_name="mcp-tool"
+    )
+    assert result.exit_code == 0, result.output
+    assert started_servers == ["fetch"]
+
+
+def test_shell_completion_uses_cached_tools_only(started_servers: list[str]) -> None:
+    """Completing subcommands never starts servers without cached tools."""
+
+    ToolCache().store(
+        [ServerConfig(name="cached", command="uvx")],
+        [
+            ToolDescriptor(
+                server_name="cached",
+                tool_name="echo",
+                description="Echo.",
+                input_schema={},
+            )
+        ],
+    )
+    runner = CliRunner()
+
+    completion_env = {
+        "_MCP_TOOL_COMPLETE": "bash_complete",
+        "COMP_WORDS": "mcp-tool ",
+        "COMP_CWORD": "1",
+    }
+    result = runner.invoke(
+        main_mod.McpToolCLI(help="test"), [], env=completion_env, prog_name="mcp-tool"
+    )
+    assert result.exit_code == 0
+    assert "cached__echo" in result.output
+    assert "fetch" not in result.output
+
+    # Options of an uncached server's tool are not completed either.
+    completion_env = {
+        "_MCP_TOOL_COMPLETE": "bash_complete",
+        "COMP_WORDS": "mcp-tool fetch__echo --",
+        "COMP_CWORD": "2",
+    }
+    result = runner.invoke(
+        main_mod.McpToolCLI(help="test"), [], env=completion_env, prog_name="mcp-tool"
+    )
+    assert result.exit_code == 0
+    assert "--text" not in result.output
+    assert started_servers == []
+
+    # Without the completion variable the same CLI discovers as usual.
+    result = runner.invoke(
+        main_mod.McpToolCLI(help="test"), ["--help"], prog_name="mcp-tool"
+    )
+    assert "fetch__echo" in result.output
+    assert started_servers == ["fetch"]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from mcp_cli import jsonutil
+from mcp_cli.main import _parse_json_arguments
+
+
+def test_loads_keeps_integers_beyond_64_bits() -> None:
+    big = 123456789012345678901234567890
+
+    assert jsonutil.loads(f'{{"id": {big}}}') == {"id": big}
+    assert jsonutil.loads(f'{{"id": {-(2**63) - 1}}}'.encode()) == {"id": -(2**63) - 1}
+    arguments = _parse_json_arguments(f'{{"id": {big}, "n": 1.5}}', None, False)
+    assert arguments == {"id": big, "n": 1.5}
+
+
+def test_dumps_handles_big_integers_and_non_str_keys() -> None:
+    big = 2**70
+
+    assert jsonutil.loads(jsonutil.dumps({"id": big})) == {"id": big}
+    assert jsonutil.loads(jsonutil.dumps({1: "one"}, indent=True)) == {"1": "one"}
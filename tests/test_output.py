@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import mcp.types as types
+
+from mcp_cli.main import _print_result
+
+
+def test_print_result_json_output_serializes_tool_result(capsys: Any) -> None:
+    result = types.CallToolResult(
+        content=[types.TextContent(type="text", text="héllo")]
+    )
+
+    _print_result(result, "json")
+
+    payload = json.loads(capsys.readouterr().out)
+    # Newer SDK versions add fields, so only the stable ones are checked.
+    assert payload["content"] == [{"type": "text", "text": "héllo"}]
+    assert payload["isError"] is False
+
+
+def test_print_result_text_output_collapses_blank_lines(capsys: Any) -> None:
+    result = types.CallToolResult(
+        content=[
+            types.TextContent(type="text", text="first\n\nsecond"),
+            types.ImageContent(type="image", data="", mimeType="image/png"),
+            types.TextContent(type="text", text="third"),
+        ]
+    )
+
+    _print_result(result, "text")
+
+    assert capsys.readouterr().out == "first\nsecond\nthird\n"
+
+
+def test_print_result_json_output_keeps_big_integers(capsys: Any) -> None:
+    big = 2**70
+    result = types.CallToolResult(content=[], structuredContent={"id": big})
+
+    _print_result(result, "json")
+
+    assert json.loads(capsys.readouterr().out)["structuredContent"] == {"id": big}
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from mcp_cli.client import ToolDescriptor
+from mcp_cli.config import ServerConfig
+from mcp_cli.tool_cache import ToolCache
+
+
+def _descriptor(server_name: str, tool_name: str) -> ToolDescriptor:
+    return ToolDescriptor(
+        server_name=server_name,
+        tool_name=tool_name,
+        description="Echo text back.",
+        input_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+    )
+
+
+def test_tool_cache_round_trips_and_tracks_server_config(tmp_path: Path) -> None:
+    """Cached tools are reused only for an identical server configuration."""
+
+    path = tmp_path / "tools.json"
+    echo = ServerConfig(name="echo", command="echo-server")
+    broken = ServerConfig(name="broken", command="missing")
+
+    ToolCache(ttl=60, path=path).store([echo, broken], [_descriptor("echo", "echo")])
+
+    cache = ToolCache(ttl=60, path=path)
+    assert cache.get(echo) == [_descriptor("echo", "echo")]
+    # Servers that produced no tools are not cached.
+    assert cache.get(broken) is None
+    # Editing the server definition invalidates its entry.
+    assert (
+        cache.get(ServerConfig(name="echo", command="echo-server", args=["--v2"]))
+        is None
+    )
+
+    cache.refresh()
+    assert cache.get(echo) is None
+
+    assert ToolCache(ttl=0, path=path).get(echo) is None
+
+
+def test_tool_cache_tracks_server_executable_mtime(tmp_path: Path) -> None:
+    """Replacing the server executable invalidates its cached tools."""
+
+    executable = tmp_path / "echo-server"
+    executable.write_text("#!/bin/sh\n")
+    executable.chmod(0o755)
+    echo = ServerConfig(name="echo", command=str(executable))
+    path = tmp_path / "tools.json"
+
+    ToolCache(ttl=60, path=path).store([echo], [_descriptor("echo", "echo")])
+    assert ToolCache(ttl=60, path=path).get(echo) == [_descriptor("echo", "echo")]
+
+    stat = executable.stat()
+    os.utime(executable, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert ToolCache(ttl=60, path=path).get(echo) is None
+
+
+def test_tool_cache_resolves_default_path_on_use(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    """A cache created before XDG_CACHE_HOME changes writes to the new location."""
+
+    cache = ToolCache(ttl=60)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "later"))
+
+    cache.store(
+        [ServerConfig(name="echo", command="echo-server")],
+        [_descriptor("echo", "echo")],
+    )
+    assert (tmp_path / "later" / "mcp-tool" / "tools.json").is_file()